@@ -7,26 +7,88 @@ Includes all constraints, relationships, and integrity rules.
 """
 
 from datetime import date
+from functools import lru_cache
 from sqlalchemy import (
-    create_engine, Column, Integer, String, Float, Boolean,
+    create_engine, event, select, insert, delete, Column, Integer, String, Float, Boolean,
     Date, ForeignKey, CheckConstraint, UniqueConstraint
 )
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import relationship, declarative_base, sessionmaker
 
 # --- Base setup ---
 Base = declarative_base()
 DEFAULT_DB = "sqlite:///transport_system.db"
 
+# Bump whenever tables or indexes change so existing databases get them on next start
+SCHEMA_VERSION = "1"
+SCHEMA_VERSION_KEY = "schema_version"
+
+# Applied to every new SQLite connection. WAL avoids the double fsync of the
+# rollback journal on each commit; NORMAL sync is still crash-safe under WAL.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, _connection_record):
+    """Tune each SQLite connection for the CLI's commit-per-action workload."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+# Driver-specific switches that turn executemany() into batched statements
+# for bulk inserts. SQLite needs nothing extra.
+EXECUTEMANY_OPTIONS = {
+    "psycopg2": {"executemany_mode": "values_plus_batch"},
+    "pyodbc": {"fast_executemany": True},
+}
+
 
 def init_engine(db_url: str = DEFAULT_DB):
     """Initialize database engine."""
-    return create_engine(db_url, echo=False, future=True)
+    # Larger pages let bulk imports go out as fewer multi-row INSERT statements
+    options = {"echo": False, "future": True, "insertmanyvalues_page_size": 1000}
+    options.update(EXECUTEMANY_OPTIONS.get(make_url(db_url).get_driver_name(), {}))
+    engine = create_engine(db_url, **options)
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _apply_sqlite_pragmas)
+    return engine
+
+
+@lru_cache(maxsize=4)
+def _session_factory(engine):
+    """
+    Build the sessionmaker for an engine once and reuse it.
+
+    Objects stay loaded across commits (no expire_on_commit), so menus don't
+    re-SELECT every instance after each save. Paths whose writes reach rows
+    the session can't see (Core deletes and updates, raw FK edits) expire explicitly.
+    """
+    return sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
 
 def create_session(engine):
     """Create and return a new session for DB interaction."""
-    Session = sessionmaker(bind=engine, autoflush=False)
-    return Session()
+    return _session_factory(engine)()
+
+
+def sqlite_type_check(column: str, *storage_classes: str, name: str):
+    """
+    CHECK that a column only stores the given SQLite storage classes (or NULL).
+
+    SQLite's STRICT tables can't be used with SQLAlchemy's VARCHAR/FLOAT/DATE
+    type names, so this gives the same engine-side type rejection per column.
+    Emitted for SQLite only; other backends enforce column types natively.
+    """
+    allowed = ", ".join(f"'{cls}'" for cls in (*storage_classes, "null"))
+    return CheckConstraint(f"typeof({column}) IN ({allowed})", name=name).ddl_if(dialect="sqlite")
 
 
 # =======================
@@ -60,12 +122,12 @@ class Term(Base):
     name = Column(String, nullable=False)
     start_date = Column(Date, nullable=False)
     end_date = Column(Date, nullable=False)
-    academic_year_id = Column(Integer, ForeignKey("academic_years.id", ondelete="CASCADE"))
+    academic_year_id = Column(Integer, ForeignKey("academic_years.id", ondelete="CASCADE"), index=True)
 
     # Relationship back to AcademicYear
     academic_year = relationship("AcademicYear", back_populates="terms")
-    # Each term can have many payments
-    payments = relationship("Payment", back_populates="term", cascade="all, delete-orphan")
+    # Each term can have many payments; query them explicitly rather than lazy-loading
+    payments = relationship("Payment", back_populates="term", cascade="all, delete-orphan", lazy="raise")
 
     __table_args__ = (
         UniqueConstraint("name", "academic_year_id", name="uq_term_name_per_year"),
@@ -85,7 +147,7 @@ class Driver(Base):
     assigned = Column(Boolean, default=False)  # Marked true if currently assigned
 
     # One driver → many buses (in case of reassignments)
-    buses = relationship("Bus", back_populates="driver")
+    buses = relationship("Bus", back_populates="driver", lazy="raise")
 
 
 class Attendant(Base):
@@ -98,7 +160,7 @@ class Attendant(Base):
     phone = Column(String)
 
     # One attendant → one bus
-    buses = relationship("Bus", back_populates="attendant")
+    buses = relationship("Bus", back_populates="attendant", lazy="raise")
 
 
 class Bus(Base):
@@ -110,10 +172,10 @@ class Bus(Base):
     bus_name = Column(String, nullable=False, unique=True)
     plate_number = Column(String, unique=True)
     capacity = Column(Integer)
-    driver_id = Column(Integer, ForeignKey("drivers.id", ondelete="SET NULL"))
-    attendant_id = Column(Integer, ForeignKey("attendants.id", ondelete="SET NULL"))
+    driver_id = Column(Integer, ForeignKey("drivers.id", ondelete="SET NULL"), index=True)
+    attendant_id = Column(Integer, ForeignKey("attendants.id", ondelete="SET NULL"), index=True)
 
-    # One bus → many students
+    # One bus → many students (listings count them in SQL instead of loading them)
     students = relationship("Student", back_populates="bus")
     # One bus → one attendant
     attendant = relationship("Attendant", back_populates="buses")
@@ -122,6 +184,7 @@ class Bus(Base):
 
     __table_args__ = (
         CheckConstraint("capacity >= 0", name="check_bus_capacity"),
+        sqlite_type_check("capacity", "integer", name="check_bus_capacity_type"),
     )
 
 
@@ -134,7 +197,7 @@ class Student(Base):
     name = Column(String, nullable=False)
     parent_contact = Column(String)
     address = Column(String)
-    bus_id = Column(Integer, ForeignKey("buses.id", ondelete="SET NULL"))
+    bus_id = Column(Integer, ForeignKey("buses.id", ondelete="SET NULL"), index=True)
     monthly_rate = Column(Float, default=0.0)
     is_active = Column(Boolean, default=True)
 
@@ -145,6 +208,7 @@ class Student(Base):
 
     __table_args__ = (
         CheckConstraint("monthly_rate >= 0", name="check_student_rate"),
+        sqlite_type_check("monthly_rate", "integer", "real", name="check_student_rate_type"),
     )
 
 
@@ -154,8 +218,9 @@ class Payment(Base):
     __tablename__ = "payments"
 
     id = Column(Integer, primary_key=True)
+    # student_id lookups are served by uq_payment_unique, which leads with it
     student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"))
-    term_id = Column(Integer, ForeignKey("terms.id", ondelete="CASCADE"))
+    term_id = Column(Integer, ForeignKey("terms.id", ondelete="CASCADE"), index=True)
     week_number = Column(Integer, nullable=True)
     amount_paid = Column(Float, default=0.0)
     balance_carried = Column(Float, default=0.0)
@@ -171,6 +236,8 @@ class Payment(Base):
         # Data validation constraints
         CheckConstraint("amount_paid >= 0", name="check_payment_amount"),
         CheckConstraint("balance_carried >= 0", name="check_balance_nonnegative"),
+        sqlite_type_check("amount_paid", "integer", "real", name="check_payment_amount_type"),
+        sqlite_type_check("balance_carried", "integer", "real", name="check_balance_type"),
         CheckConstraint(
             "week_number IS NULL OR (week_number >= 1 AND week_number <= 20)",
             name="check_week_range"
@@ -182,8 +249,9 @@ class SystemSetting(Base):
     """Stores key-value pairs for global configuration (like default rates, export paths)."""
     __tablename__ = "system_settings"
 
-    id = Column(Integer, primary_key=True)
-    key = Column(String, unique=True, nullable=False)
+    # Keyed by name so lookups are primary-key gets. Older databases still have an
+    # INTEGER id primary key here; SQLite fills it in, and key stays UNIQUE there.
+    key = Column(String, primary_key=True)
     value = Column(String, nullable=True)
 
 
@@ -194,3 +262,37 @@ class SystemSetting(Base):
 def create_all_tables(engine):
     """Create all database tables (if they don't exist)."""
     Base.metadata.create_all(engine)
+    # create_all skips tables that already exist, so indexes added to the
+    # models later would never reach older databases without this pass.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
+
+def stamp_schema_version(conn):
+    """Record the current SCHEMA_VERSION in system_settings, inside the caller's transaction."""
+    conn.execute(delete(SystemSetting).where(SystemSetting.key == SCHEMA_VERSION_KEY))
+    conn.execute(insert(SystemSetting).values(key=SCHEMA_VERSION_KEY, value=SCHEMA_VERSION))
+
+
+def ensure_schema(engine):
+    """
+    Create missing tables/indexes only if the database's recorded schema version is stale.
+
+    Skips the per-table existence checks of create_all on every normal start.
+    A missing settings table (brand new database) counts as stale.
+    """
+    try:
+        with engine.connect() as conn:
+            stored = conn.execute(
+                select(SystemSetting.value).where(SystemSetting.key == SCHEMA_VERSION_KEY)
+            ).scalar()
+    except OperationalError:
+        stored = None
+
+    if stored == SCHEMA_VERSION:
+        return
+
+    create_all_tables(engine)
+    with engine.begin() as conn:
+        stamp_schema_version(conn)
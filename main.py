@@ -11,7 +11,7 @@ Handles:
 
 import sys
 from sqlalchemy.orm import Session
-from db_models import create_session, init_engine, DEFAULT_DB, create_all_tables  # ✅ added create_all_tables
+from db_models import create_session, init_engine, DEFAULT_DB, ensure_schema
 
 # Import menu modules
 from menus.buses import buses_menu
@@ -29,6 +29,26 @@ from utils.helpers import clear_screen, pause
 # -----------------------------------------------------------------------------
 # MAIN MENU
 # -----------------------------------------------------------------------------
+def open_settings(session: Session):
+    """Run the settings menu, pausing afterwards so its last message stays visible."""
+    settings_menu(session)
+    pause()
+
+
+# Menu option → sub-menu; option 10 (exit) is handled by the loop itself
+MENU_ACTIONS = {
+    "1": buses_menu,
+    "2": attendants_menu,
+    "3": drivers_menu,
+    "4": students_menu,
+    "5": terms_menu,
+    "6": academic_years_menu,
+    "7": payments_menu,
+    "8": reports_menu,
+    "9": open_settings,
+}
+
+
 def main_menu(session: Session):
     """Displays the main navigation menu."""
     while True:
@@ -47,25 +67,9 @@ def main_menu(session: Session):
 
         choice = input("Select option: ").strip()
 
-        if choice == "1":
-            buses_menu(session)
-        elif choice == "2":
-            attendants_menu(session)
-        elif choice == "3":
-            drivers_menu(session)
-        elif choice == "4":
-            students_menu(session)
-        elif choice == "5":
-            terms_menu(session)
-        elif choice == "6":
-            academic_years_menu(session)
-        elif choice == "7":
-            payments_menu(session)
-        elif choice == "8":
-            reports_menu(session)
-        elif choice == "9":
-            settings_menu(session)
-            pause()
+        action = MENU_ACTIONS.get(choice)
+        if action:
+            action(session)
         elif choice == "10":
             print("\nGoodbye!\n")
             break
@@ -84,8 +88,8 @@ def main():
         engine = init_engine(DEFAULT_DB)
 
         # ✅ Ensure all tables exist (non-destructive)
-        # This auto-creates any missing tables, like new models added later.
-        create_all_tables(engine)
+        # Missing tables/indexes are only created when the stored schema version is out of date.
+        ensure_schema(engine)
 
         # --- Session creation ---
         session = create_session(engine)
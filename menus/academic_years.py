@@ -10,11 +10,18 @@ Admin can:
 2. Add new years
 3. Edit details (like start/end dates)
 4. Delete years (with confirmation)
+5. Import many years at once from a CSV file or bulk entry
 """
 
-from utils.helpers import pause, clear_screen, get_valid_input, confirm_action, is_date
-from db_models import AcademicYear
-from datetime import datetime
+from sqlalchemy import select, insert, update, delete
+from sqlalchemy.exc import SQLAlchemyError
+from utils.helpers import pause, clear_screen, get_valid_input, confirm_action, parse_iso_date
+from utils.bulk import read_csv_rows, bulk_insert
+from db_models import AcademicYear, Term, Payment
+
+# Listing views only print these fields, so they skip full ORM hydration
+YEAR_COLUMNS = (AcademicYear.id, AcademicYear.name, AcademicYear.start_date, AcademicYear.end_date)
+LIST_BATCH_SIZE = 200
 
 
 # -----------------------------------------------------------------------------
@@ -26,14 +33,18 @@ def list_academic_years(session):
     Includes their date ranges to help visualize school cycles.
     """
     clear_screen()
-    years = session.query(AcademicYear).all()
+    # Stream rows in batches rather than materializing the whole table
+    rows = session.execute(select(*YEAR_COLUMNS).execution_options(yield_per=LIST_BATCH_SIZE))
+
+    shown = 0
+    for year_id, name, start_date, end_date in rows:
+        if not shown:
+            print("--- Academic Years ---")
+        print(f"{year_id}. {name} | {start_date} → {end_date}")
+        shown += 1
 
-    if not years:
+    if not shown:
         print("No academic years found.")
-    else:
-        print("--- Academic Years ---")
-        for y in years:
-            print(f"{y.id}. {y.name} | {y.start_date} → {y.end_date}")
 
     pause()
 
@@ -59,33 +70,33 @@ def add_academic_year(session):
         pause()
         return
 
-    # Date range ensures accurate reporting and linking with terms
-    start_str = get_valid_input("Start date (YYYY-MM-DD): ", is_date, "⚠️ Invalid date format. Use YYYY-MM-DD.")
-    if start_str is None:
+    # Date range ensures accurate reporting and linking with terms (parsed as they are validated)
+    start_date = get_valid_input("Start date (YYYY-MM-DD): ", error_msg="⚠️ Invalid date format. Use YYYY-MM-DD.", converter=parse_iso_date)
+    if start_date is None:
         print("Operation cancelled.")
         pause()
         return
-    end_str = get_valid_input("End date (YYYY-MM-DD): ", is_date, "⚠️ Invalid date format. Use YYYY-MM-DD.")
-    if end_str is None:
+    end_date = get_valid_input("End date (YYYY-MM-DD): ", error_msg="⚠️ Invalid date format. Use YYYY-MM-DD.", converter=parse_iso_date)
+    if end_date is None:
         print("Operation cancelled.")
         pause()
         return
 
-    start_date = datetime.strptime(start_str, "%Y-%m-%d").date()
-    end_date = datetime.strptime(end_str, "%Y-%m-%d").date()
-
     # Logical validation: no backwards or same-day years
     if end_date <= start_date:
         print("❌ End date must be after start date.")
         pause()
         return
 
-    # Create & commit the new record
-    year = AcademicYear(name=name, start_date=start_date, end_date=end_date)
-    session.add(year)
+    # Create & commit the new record; RETURNING gives back the id in the same round-trip
+    new_id = session.execute(
+        insert(AcademicYear)
+        .values(name=name, start_date=start_date, end_date=end_date)
+        .returning(AcademicYear.id)
+    ).scalar_one()
     session.commit()
 
-    print(f"✅ Academic year '{name}' added successfully.")
+    print(f"✅ Academic year '{name}' (ID {new_id}) added successfully.")
     pause()
 
 
@@ -102,28 +113,27 @@ def edit_academic_year(session):
     print("--- Edit Academic Year ---")
     print("Type 'cancel' at any prompt to exit.\n")
 
-    years = session.query(AcademicYear).all()
+    rows = session.execute(select(*YEAR_COLUMNS)).all()
 
-    if not years:
+    if not rows:
         print("No academic years found.")
         pause()
         return
 
-    for y in years:
-        print(f"{y.id}. {y.name} | {y.start_date} → {y.end_date}")
+    for year_id, name, start_date, end_date in rows:
+        print(f"{year_id}. {name} | {start_date} → {end_date}")
+
+    rows_by_id = {r.id: r for r in rows}
 
     # User selects the record by ID
-    year_id_input = get_valid_input("\nEnter ID of year to edit: ", lambda x: x.isdigit() and int(x) in [y.id for y in years], "⚠️ Invalid Academic Year ID.")
+    year_id_input = get_valid_input("\nEnter ID of year to edit: ", lambda x: x.isdigit() and int(x) in rows_by_id, "⚠️ Invalid Academic Year ID.")
     if year_id_input is None:
         print("Operation cancelled.")
         pause()
         return
     year_id = int(year_id_input)
-    year = session.query(AcademicYear).get(year_id)
-    if not year:
-        print("❌ Invalid academic year ID.")
-        pause()
-        return
+    # Current values come from the listing; no need to fetch the row again
+    year = rows_by_id[year_id]
 
     # Show current data to guide user
     print(f"\nEditing: {year.name} ({year.start_date} → {year.end_date})")
@@ -134,28 +144,33 @@ def edit_academic_year(session):
         print("Operation cancelled.")
         pause()
         return
-    new_start = get_valid_input(f"New start date [{year.start_date}]: ", is_date, "⚠️ Invalid date format. Use YYYY-MM-DD.") or str(year.start_date)
-    if new_start is None:
+    start_date = get_valid_input(f"New start date [{year.start_date}]: ", error_msg="⚠️ Invalid date format. Use YYYY-MM-DD.", converter=lambda x: parse_iso_date(x) if x else year.start_date)
+    if start_date is None:
         print("Operation cancelled.")
         pause()
         return
-    new_end = get_valid_input(f"New end date [{year.end_date}]: ", is_date, "⚠️ Invalid date format. Use YYYY-MM-DD.") or str(year.end_date)
-    if new_end is None:
+    end_date = get_valid_input(f"New end date [{year.end_date}]: ", error_msg="⚠️ Invalid date format. Use YYYY-MM-DD.", converter=lambda x: parse_iso_date(x) if x else year.end_date)
+    if end_date is None:
         print("Operation cancelled.")
         pause()
         return
 
-    start_date = datetime.strptime(new_start, "%Y-%m-%d").date()
-    end_date = datetime.strptime(new_end, "%Y-%m-%d").date()
-
     if end_date <= start_date:
         print("❌ End date must be after start date.")
         pause()
         return
 
-    # Save updates
-    year.name, year.start_date, year.end_date = new_name, start_date, end_date
-    session.commit()
+    # Save updates — one UPDATE carrying only the fields that changed
+    changes = {}
+    if new_name != year.name:
+        changes["name"] = new_name
+    if start_date != year.start_date:
+        changes["start_date"] = start_date
+    if end_date != year.end_date:
+        changes["end_date"] = end_date
+    if changes:
+        session.execute(update(AcademicYear).where(AcademicYear.id == year_id).values(**changes))
+        session.commit()
 
     print("✅ Academic year updated successfully.")
     pause()
@@ -175,45 +190,174 @@ def delete_academic_year(session):
     print("--- Delete Academic Year ---")
     print("Type 'cancel' at any prompt to exit.\n")
 
-    years = session.query(AcademicYear).all()
+    rows = session.execute(select(*YEAR_COLUMNS)).all()
 
-    if not years:
+    if not rows:
         print("No academic years available to delete.")
         pause()
         return
 
-    for y in years:
-        print(f"{y.id}. {y.name} | {y.start_date} → {y.end_date}")
+    for year_id, name, start_date, end_date in rows:
+        print(f"{year_id}. {name} | {start_date} → {end_date}")
+
+    rows_by_id = {r.id: r for r in rows}
 
     # Pick year by ID
-    year_id_input = get_valid_input("\nEnter ID of year to delete: ", lambda x: x.isdigit() and int(x) in [y.id for y in years], "⚠️ Invalid Academic Year ID.")
+    year_id_input = get_valid_input("\nEnter ID of year to delete: ", lambda x: x.isdigit() and int(x) in rows_by_id, "⚠️ Invalid Academic Year ID.")
     if year_id_input is None:
         print("Operation cancelled.")
         pause()
         return
     year_id = int(year_id_input)
-    year = session.query(AcademicYear).get(year_id)
-    if not year:
-        print("❌ Invalid academic year ID.")
-        pause()
-        return
+    year_name = rows_by_id[year_id].name
 
     # Confirmation gate — prevents accidental full data loss
-    if not confirm_action(f"delete academic year '{year.name}' (this may affect dependent terms and payments)"):
+    confirm_prompt = f"delete academic year '{year_name}' (this may affect dependent terms and payments)"
+    if not confirm_action(confirm_prompt):
         print("❌ Deletion cancelled.")
         pause()
         return
 
-    session.delete(year)
+    # Set-based DELETEs for the year's payments, terms, then the year itself, in one transaction
+    year_term_ids = select(Term.id).where(Term.academic_year_id == year_id)
+    session.execute(delete(Payment).where(Payment.term_id.in_(year_term_ids)))
+    session.execute(delete(Term).where(Term.academic_year_id == year_id))
+    session.execute(delete(AcademicYear).where(AcademicYear.id == year_id))
     session.commit()
+    # Dependent rows were removed by Core DELETEs, not the session
+    session.expire_all()
 
     print("✅ Academic year deleted successfully.")
     pause()
 
 
+# -----------------------------------------------------------------------------
+# IMPORT ACADEMIC YEARS FROM CSV
+# -----------------------------------------------------------------------------
+def import_academic_years(session):
+    """
+    Bulk-loads academic years from a CSV file with columns name, start_date, end_date.
+
+    Every row is validated first; the whole file is then inserted in one
+    batch and committed once, so a bad file never leaves a partial import.
+    """
+    clear_screen()
+    print("--- Import Academic Years (CSV) ---")
+    print("Expected columns: name, start_date, end_date (dates as YYYY-MM-DD).")
+    print("Type 'cancel' at any prompt to exit.\n")
+
+    path = get_valid_input("CSV file path: ", lambda x: x.strip(), "⚠️ Path cannot be empty.")
+    if path is None:
+        print("Operation cancelled.")
+        pause()
+        return
+
+    try:
+        raw_rows = read_csv_rows(path, ("name", "start_date", "end_date"))
+    except (IOError, ValueError) as e:
+        print(f"❌ Could not read file: {e}")
+        pause()
+        return
+
+    rows = []
+    for line_no, raw in enumerate(raw_rows, start=2):
+        start_date = parse_iso_date(raw["start_date"])
+        end_date = parse_iso_date(raw["end_date"])
+        if not raw["name"] or start_date is None or end_date is None:
+            print(f"❌ Line {line_no}: name and valid YYYY-MM-DD dates are required.")
+            pause()
+            return
+        if end_date <= start_date:
+            print(f"❌ Line {line_no}: end date must be after start date.")
+            pause()
+            return
+        rows.append({"name": raw["name"], "start_date": start_date, "end_date": end_date})
+
+    if not rows:
+        print("No rows found in file.")
+        pause()
+        return
+
+    try:
+        count = bulk_insert(session, AcademicYear, rows)
+        print(f"✅ Imported {count} academic year(s).")
+    except SQLAlchemyError as e:
+        session.rollback()
+        print(f"❌ Import failed, no years were added: {e}")
+
+    pause()
+
+
+# -----------------------------------------------------------------------------
+# BULK ADD ACADEMIC YEARS
+# -----------------------------------------------------------------------------
+def bulk_add_academic_years(session):
+    """
+    Collects several academic years at the prompt and saves them in one transaction.
+
+    Handy at setup time: entries are only written once the admin finishes,
+    and cancelling discards the whole batch.
+    """
+    clear_screen()
+    print("--- Bulk Add Academic Years ---")
+    print("Leave the name blank to finish. Nothing is saved until then.")
+    print("Type 'cancel' at any prompt to discard all entries.\n")
+
+    rows = []
+    while True:
+        name = get_valid_input(f"Year #{len(rows) + 1} name (blank to finish): ")
+        if name is None:
+            print("Operation cancelled. No years were added.")
+            pause()
+            return
+        if not name:
+            break
+
+        start_date = get_valid_input("Start date (YYYY-MM-DD): ", error_msg="⚠️ Invalid date format. Use YYYY-MM-DD.", converter=parse_iso_date)
+        if start_date is None:
+            print("Operation cancelled. No years were added.")
+            pause()
+            return
+        end_date = get_valid_input("End date (YYYY-MM-DD): ", error_msg="⚠️ Invalid date format. Use YYYY-MM-DD.", converter=parse_iso_date)
+        if end_date is None:
+            print("Operation cancelled. No years were added.")
+            pause()
+            return
+
+        if end_date <= start_date:
+            print("❌ End date must be after start date. Entry skipped.\n")
+            continue
+        rows.append({"name": name, "start_date": start_date, "end_date": end_date})
+
+    if not rows:
+        print("No academic years entered.")
+        pause()
+        return
+
+    try:
+        count = bulk_insert(session, AcademicYear, rows)
+        print(f"✅ Added {count} academic year(s).")
+    except SQLAlchemyError as e:
+        session.rollback()
+        print(f"❌ Error adding academic years, none were saved: {e}")
+
+    pause()
+
+
 # -----------------------------------------------------------------------------
 # MAIN MENU CONTROLLER
 # -----------------------------------------------------------------------------
+# Menu option → handler; option 7 (back) is handled by the loop itself
+MENU_ACTIONS = {
+    "1": list_academic_years,
+    "2": add_academic_year,
+    "3": edit_academic_year,
+    "4": delete_academic_year,
+    "5": import_academic_years,
+    "6": bulk_add_academic_years,
+}
+
+
 def academic_years_menu(session):
     """
     The CLI controller for managing academic years.
@@ -227,20 +371,17 @@ def academic_years_menu(session):
         print("2. Add Academic Year")
         print("3. Edit Academic Year")
         print("4. Delete Academic Year")
-        print("5. Back to Main Menu")
+        print("5. Import Academic Years from CSV")
+        print("6. Bulk Add Academic Years")
+        print("7. Back to Main Menu")
 
         choice = input("\nSelect option: ").strip()
 
         # Route to correct handler based on user input
-        if choice == "1":
-            list_academic_years(session)
-        elif choice == "2":
-            add_academic_year(session)
-        elif choice == "3":
-            edit_academic_year(session)
-        elif choice == "4":
-            delete_academic_year(session)
-        elif choice == "5":
+        action = MENU_ACTIONS.get(choice)
+        if action:
+            action(session)
+        elif choice == "7":
             break
         else:
             print("Invalid option.")
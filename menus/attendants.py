@@ -6,12 +6,19 @@ Now includes:
 - Input validation
 - Graceful error handling (no crashes)
 - Safe DB rollbacks on failure
+- Bulk import from CSV and bulk manual entry (single commit)
 """
 
 from utils.helpers import pause, clear_screen, get_valid_input, confirm_action, is_phone_number
-from db_models import Attendant
+from utils.bulk import read_csv_rows, bulk_insert
+from db_models import Attendant, Bus
+from sqlalchemy import select, insert, update, delete
 from sqlalchemy.orm import Session
 
+# Listing views only print these fields, so they skip full ORM hydration
+ATTENDANT_COLUMNS = (Attendant.id, Attendant.name, Attendant.phone)
+LIST_BATCH_SIZE = 200
+
 
 # -----------------------------------------------------------------------------
 # LIST ATTENDANTS
@@ -21,17 +28,18 @@ def list_attendants(session: Session):
     clear_screen()
     print("=== List of Attendants ===\n")
 
-    attendants = session.query(Attendant).all()
-
-    if not attendants:
-        print("No attendants found.")
-        pause()
-        return
+    # Stream rows in batches rather than materializing the whole table
+    rows = session.execute(select(*ATTENDANT_COLUMNS).execution_options(yield_per=LIST_BATCH_SIZE))
 
-    for att in attendants:
-        print(f"[{att.id}] {att.name}")
-        print(f"  Phone: {att.phone}")
+    shown = 0
+    for att_id, name, phone in rows:
+        print(f"[{att_id}] {name}")
+        print(f"  Phone: {phone}")
         print("-" * 30)
+        shown += 1
+
+    if not shown:
+        print("No attendants found.")
 
     pause()
 
@@ -60,11 +68,13 @@ def add_attendant(session: Session):
         return
 
     try:
-        attendant = Attendant(name=name, phone=phone)
-        session.add(attendant)
+        # INSERT ... RETURNING hands back the new id without a follow-up SELECT
+        new_id = session.execute(
+            insert(Attendant).values(name=name, phone=phone).returning(Attendant.id)
+        ).scalar_one()
         session.commit()
 
-        print("\n✅ Attendant added successfully!")
+        print(f"\n✅ Attendant '{name}' (ID {new_id}) added successfully!")
 
     except Exception as e:
         session.rollback()  # Revert any partial transaction
@@ -82,27 +92,26 @@ def update_attendant(session: Session):
     print("=== Update Attendant ===\n")
     print("Type 'cancel' at any prompt to exit.\n")
 
-    attendants = session.query(Attendant).all()
-    if not attendants:
+    rows = session.execute(select(*ATTENDANT_COLUMNS)).all()
+    if not rows:
         print("No attendants found.")
         pause()
         return
 
-    for att in attendants:
-        print(f"[{att.id}] {att.name} ({att.phone})")
+    for att_id, name, phone in rows:
+        print(f"[{att_id}] {name} ({phone})")
+
+    rows_by_id = {r.id: r for r in rows}
 
     # Get and validate attendant ID
-    att_id_input = get_valid_input("\nEnter Attendant ID to update: ", lambda x: x.isdigit() and int(x) in [att.id for att in attendants], "⚠️ Invalid Attendant ID.")
+    att_id_input = get_valid_input("\nEnter Attendant ID to update: ", lambda x: x.isdigit() and int(x) in rows_by_id, "⚠️ Invalid Attendant ID.")
     if att_id_input is None:
         print("Operation cancelled.")
         pause()
         return
     att_id = int(att_id_input)
-    attendant = session.get(Attendant, att_id)
-    if not attendant:
-        print("❌ Attendant not found.")
-        pause()
-        return
+    # Current values come from the listing; no need to fetch the row again
+    attendant = rows_by_id[att_id]
 
     print("\nLeave any field blank to keep existing value.\n")
 
@@ -120,12 +129,16 @@ def update_attendant(session: Session):
         return
 
     try:
+        # One UPDATE carrying only the fields that changed
+        changes = {}
         if new_name != attendant.name:
-            attendant.name = new_name
+            changes["name"] = new_name
         if new_phone != attendant.phone:
-            attendant.phone = new_phone
+            changes["phone"] = new_phone
 
-        session.commit()
+        if changes:
+            session.execute(update(Attendant).where(Attendant.id == att_id).values(**changes))
+            session.commit()
         print("\n✅ Attendant updated successfully!")
 
     except Exception as e:
@@ -144,37 +157,40 @@ def delete_attendant(session: Session):
     print("=== Delete Attendant ===\n")
     print("Type 'cancel' at any prompt to exit.\n")
 
-    attendants = session.query(Attendant).all()
-    if not attendants:
+    rows = session.execute(select(*ATTENDANT_COLUMNS)).all()
+    if not rows:
         print("No attendants found.")
         pause()
         return
 
-    for att in attendants:
-        print(f"[{att.id}] {att.name} ({att.phone})")
+    for att_id, name, phone in rows:
+        print(f"[{att_id}] {name} ({phone})")
+
+    rows_by_id = {r.id: r for r in rows}
 
     # Get and validate attendant ID
-    att_id_input = get_valid_input("\nEnter Attendant ID to delete: ", lambda x: x.isdigit() and int(x) in [att.id for att in attendants], "⚠️ Invalid Attendant ID.")
+    att_id_input = get_valid_input("\nEnter Attendant ID to delete: ", lambda x: x.isdigit() and int(x) in rows_by_id, "⚠️ Invalid Attendant ID.")
     if att_id_input is None:
         print("Operation cancelled.")
         pause()
         return
     att_id = int(att_id_input)
-    attendant = session.get(Attendant, att_id)
-    if not attendant:
-        print("❌ Attendant not found.")
-        pause()
-        return
+    attendant = rows_by_id[att_id]
 
     # Use confirm_action for better UX
-    if not confirm_action(f"delete attendant '{attendant.name}'"):
+    confirm_prompt = f"delete attendant '{attendant.name}'"
+    if not confirm_action(confirm_prompt):
         print("❌ Deletion cancelled.")
         pause()
         return
 
     try:
-        session.delete(attendant)
+        # Unlink any bus keeping this attendant, then a single DELETE, in one transaction
+        session.execute(update(Bus).where(Bus.attendant_id == att_id).values(attendant_id=None))
+        session.execute(delete(Attendant).where(Attendant.id == att_id))
         session.commit()
+        # Buses were unlinked by a Core UPDATE; reload them on next access
+        session.expire_all()
         print("\n✅ Attendant deleted successfully.")
 
     except Exception as e:
@@ -184,9 +200,110 @@ def delete_attendant(session: Session):
     pause()
 
 
+# -----------------------------------------------------------------------------
+# IMPORT ATTENDANTS FROM CSV
+# -----------------------------------------------------------------------------
+def import_attendants(session: Session):
+    """Bulk-load attendants from a CSV file (columns: name, phone) in one commit."""
+    clear_screen()
+    print("=== Import Attendants (CSV) ===\n")
+    print("Expected columns: name, phone")
+    print("Type 'cancel' at any prompt to exit.\n")
+
+    path = get_valid_input("CSV file path: ", lambda x: x.strip(), "⚠️ Path cannot be empty.")
+    if path is None:
+        print("Operation cancelled.")
+        pause()
+        return
+
+    try:
+        raw_rows = read_csv_rows(path, ("name", "phone"))
+    except (IOError, ValueError) as e:
+        print(f"\n❌ Could not read file: {e}")
+        pause()
+        return
+
+    rows = []
+    for line_no, raw in enumerate(raw_rows, start=2):
+        if not raw["name"] or not is_phone_number(raw["phone"]):
+            print(f"\n❌ Line {line_no}: a name and a valid phone number are required.")
+            pause()
+            return
+        rows.append({"name": raw["name"], "phone": raw["phone"]})
+
+    if not rows:
+        print("No rows found in file.")
+        pause()
+        return
+
+    try:
+        count = bulk_insert(session, Attendant, rows)
+        print(f"\n✅ Imported {count} attendant(s).")
+
+    except Exception as e:
+        session.rollback()
+        print(f"\n❌ Import failed, no attendants were added: {e}")
+
+    pause()
+
+
+# -----------------------------------------------------------------------------
+# BULK ADD ATTENDANTS
+# -----------------------------------------------------------------------------
+def bulk_add_attendants(session: Session):
+    """Enter several attendants in a row and save them all in a single transaction."""
+    clear_screen()
+    print("=== Bulk Add Attendants ===\n")
+    print("Leave the name blank to finish. Nothing is saved until then.")
+    print("Type 'cancel' at any prompt to discard all entries.\n")
+
+    rows = []
+    while True:
+        name = get_valid_input(f"Attendant #{len(rows) + 1} Name (blank to finish): ")
+        if name is None:
+            print("Operation cancelled. No attendants were added.")
+            pause()
+            return
+        if not name:
+            break
+
+        phone = get_valid_input("Phone Number: ", is_phone_number, "⚠️ Invalid phone number format.")
+        if phone is None:
+            print("Operation cancelled. No attendants were added.")
+            pause()
+            return
+        rows.append({"name": name, "phone": phone})
+
+    if not rows:
+        print("No attendants entered.")
+        pause()
+        return
+
+    try:
+        count = bulk_insert(session, Attendant, rows)
+        print(f"\n✅ Added {count} attendant(s).")
+
+    except Exception as e:
+        session.rollback()
+        print(f"\n❌ Error adding attendants, none were saved: {e}")
+
+    pause()
+
+
 # -----------------------------------------------------------------------------
 # ATTENDANTS MENU CONTROLLER
 # -----------------------------------------------------------------------------
+# Menu option → handler; option 7 (back) is handled by the loop itself
+MENU_ACTIONS = {
+    "1": list_attendants,
+    "2": add_attendant,
+    "3": update_attendant,
+    "4": delete_attendant,
+    "5": import_attendants,
+    "6": bulk_add_attendants,
+}
+
+
 def attendants_menu(session: Session):
     """CLI navigation menu for managing attendants with error safety."""
     while True:
@@ -196,19 +313,16 @@ def attendants_menu(session: Session):
         print("2. Add New Attendant")
         print("3. Update Attendant Info")
         print("4. Delete Attendant")
-        print("5. Back to Main Menu")
+        print("5. Import Attendants from CSV")
+        print("6. Bulk Add Attendants")
+        print("7. Back to Main Menu")
 
         choice = input("\nSelect option: ").strip()
 
-        if choice == "1":
-            list_attendants(session)
-        elif choice == "2":
-            add_attendant(session)
-        elif choice == "3":
-            update_attendant(session)
-        elif choice == "4":
-            delete_attendant(session)
-        elif choice == "5":
+        action = MENU_ACTIONS.get(choice)
+        if action:
+            action(session)
+        elif choice == "7":
             break
         else:
             print("⚠️ Invalid choice.")
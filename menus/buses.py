@@ -6,11 +6,34 @@ Includes:
 - Input validation for numeric and text fields
 - Safe database commits with rollback on error
 - Delete confirmation before data removal
+- Bulk import from CSV (single commit)
 """
 
+import sys
 from utils.helpers import pause, clear_screen, get_valid_input, confirm_action, is_non_negative_integer, can_delete_record
+from utils.bulk import read_csv_rows, bulk_insert
 from db_models import Bus, Driver, Attendant, Student
-from sqlalchemy.orm import Session
+from sqlalchemy import select, delete, func
+from sqlalchemy.orm import Session, selectinload
+
+# Driver/attendant for every listed bus, fetched as one IN query per relationship
+BUS_LISTING_OPTIONS = (selectinload(Bus.driver), selectinload(Bus.attendant))
+
+
+def buses_with_student_counts(session: Session, *options) -> list:
+    """(Bus, student_count) rows for every bus; the counts come from the same SELECT via GROUP BY."""
+    stmt = (
+        select(Bus, func.count(Student.id))
+        .outerjoin(Student, Student.bus_id == Bus.id)
+        .group_by(Bus.id)
+        .options(*options)
+    )
+    return session.execute(stmt).all()
+
+
+def bus_names_by_id(session: Session) -> dict:
+    """{bus id: bus name} for every bus, for listings that only show the name."""
+    return dict(session.execute(select(Bus.id, Bus.bus_name)).all())
 
 
 # -----------------------------------------------------------------------------
@@ -21,23 +44,26 @@ def list_buses(session: Session):
     clear_screen()
     print("=== List of Buses ===\n")
 
-    buses = session.query(Bus).all()
+    buses = buses_with_student_counts(session, *BUS_LISTING_OPTIONS)
     if not buses:
         print("No buses found.")
         pause()
         return
 
-    for bus in buses:
+    separator = "-" * 50
+    # Build the whole listing first and write it in one go
+    out = []
+    for bus, student_count in buses:
         driver_name = bus.driver.name if bus.driver else "—"
         attendant_name = bus.attendant.name if bus.attendant else "—"
-        student_count = len(bus.students) if bus.students else 0
         utilization = (student_count / bus.capacity * 100) if bus.capacity and bus.capacity > 0 else 0
 
-        print(f"[{bus.id}] {bus.bus_name}")
-        print(f"  Seats: {student_count}/{bus.capacity} filled ({utilization:.1f}%)")
-        print(f"  Driver: {driver_name}")
-        print(f"  Attendant: {attendant_name}")
-        print("-" * 50)
+        out.append(f"[{bus.id}] {bus.bus_name}")
+        out.append(f"  Seats: {student_count}/{bus.capacity} filled ({utilization:.1f}%)")
+        out.append(f"  Driver: {driver_name}")
+        out.append(f"  Attendant: {attendant_name}")
+        out.append(separator)
+    sys.stdout.write("\n".join(out) + "\n")
 
     pause()
 
@@ -68,11 +94,13 @@ def add_bus(session: Session):
 
     # Optional driver
     print("\nAvailable Drivers:")
-    drivers = session.query(Driver).all()
+    # Only id/name are shown; the chosen driver alone is loaded as an object below
+    drivers = session.execute(select(Driver.id, Driver.name)).all()
     if drivers:
-        for d in drivers:
-            print(f"[{d.id}] {d.name}")
-        driver_id_input = get_valid_input("Assign Driver ID (or leave blank): ", lambda x: not x or (x.isdigit() and int(x) in [d.id for d in drivers]), "⚠️ Invalid Driver ID.")
+        for did, dname in drivers:
+            print(f"[{did}] {dname}")
+        driver_ids = {did for did, _ in drivers}
+        driver_id_input = get_valid_input("Assign Driver ID (or leave blank): ", lambda x: not x or (x.isdigit() and int(x) in driver_ids), "⚠️ Invalid Driver ID.")
         if driver_id_input is None:
             print("Operation cancelled.")
             pause()
@@ -84,11 +112,12 @@ def add_bus(session: Session):
 
     # Optional attendant
     print("\nAvailable Attendants:")
-    attendants = session.query(Attendant).all()
+    attendants = session.execute(select(Attendant.id, Attendant.name)).all()
     if attendants:
-        for a in attendants:
-            print(f"[{a.id}] {a.name}")
-        attendant_id_input = get_valid_input("Assign Attendant ID (or leave blank): ", lambda x: not x or (x.isdigit() and int(x) in [a.id for a in attendants]), "⚠️ Invalid Attendant ID.")
+        for aid, aname in attendants:
+            print(f"[{aid}] {aname}")
+        attendant_ids = {aid for aid, _ in attendants}
+        attendant_id_input = get_valid_input("Assign Attendant ID (or leave blank): ", lambda x: not x or (x.isdigit() and int(x) in attendant_ids), "⚠️ Invalid Attendant ID.")
         if attendant_id_input is None:
             print("Operation cancelled.")
             pause()
@@ -121,37 +150,35 @@ def update_bus(session: Session):
     print("=== Update Bus ===\n")
     print("Type 'cancel' at any prompt to exit.\n")
 
-    buses = session.query(Bus).all()
+    # Buses and their seat counts in one query; driver/attendant lists are only
+    # fetched if the user chooses to reassign below
+    buses = buses_with_student_counts(session)
     if not buses:
         print("No buses found.")
         pause()
         return
 
-    for b in buses:
-        student_count = len(b.students) if b.students else 0
+    for b, student_count in buses:
         print(f"[{b.id}] {b.bus_name} (Seats: {student_count}/{b.capacity} filled)")
 
     # Get and validate bus ID
-    bus_id_input = get_valid_input("\nEnter Bus ID to update: ", lambda x: x.isdigit() and int(x) in [b.id for b in buses], "⚠️ Invalid Bus ID.")
+    buses_by_id = {b.id: b for b, _ in buses}
+    bus_id_input = get_valid_input("\nEnter Bus ID to update: ", lambda x: x.isdigit() and int(x) in buses_by_id, "⚠️ Invalid Bus ID.")
     if bus_id_input is None:
         print("Operation cancelled.")
         pause()
         return
-    bus_id = int(bus_id_input)
-    bus = session.get(Bus, bus_id)
-    if not bus:
-        print("❌ Bus not found.")
-        pause()
-        return
+    bus = buses_by_id[int(bus_id_input)]
 
     print("\nLeave fields blank to keep current values.\n")
 
     # Get and validate new name
-    new_name = get_valid_input(f"New Name [{bus.bus_name}]: ", lambda x: x.strip() or bus.bus_name, "⚠️ Name cannot be empty.") or bus.bus_name
+    new_name = get_valid_input(f"New Name [{bus.bus_name}]: ")
     if new_name is None:
         print("Operation cancelled.")
         pause()
         return
+    new_name = new_name or bus.bus_name
     # Get and validate new capacity
     new_capacity_input = get_valid_input(f"New Capacity [{bus.capacity}]: ", is_non_negative_integer, "⚠️ Capacity must be a non-negative integer.")
     if new_capacity_input is None:
@@ -160,40 +187,57 @@ def update_bus(session: Session):
         return
     new_capacity = int(new_capacity_input) if new_capacity_input else bus.capacity
 
+    # Optionally reassign driver/attendant; each list is only queried if asked for.
+    # Nothing is assigned to the bus until every prompt is answered, so a cancel leaves it untouched.
+    driver_id_input = ""
+    reassign_driver = get_valid_input("\nReassign driver? (y/N): ", lambda x: x.lower() in ['y', 'n', ''], "⚠️ Please enter 'y' or 'n'.")
+    if reassign_driver is None:
+        print("Operation cancelled.")
+        pause()
+        return
+    drivers = session.execute(select(Driver.id, Driver.name)).all() if reassign_driver.lower() == "y" else None
+    if drivers:
+        print("\nReassign Driver (leave blank to skip):")
+        for did, dname in drivers:
+            print(f"[{did}] {dname}")
+        driver_ids = {did for did, _ in drivers}
+        driver_id_input = get_valid_input("New Driver ID (or blank): ", lambda x: not x or (x.isdigit() and int(x) in driver_ids), "⚠️ Invalid Driver ID.")
+        if driver_id_input is None:
+            print("Operation cancelled.")
+            pause()
+            return
+    elif drivers is not None:
+        print("No drivers available.")
+
+    attendant_id_input = ""
+    reassign_attendant = get_valid_input("\nReassign attendant? (y/N): ", lambda x: x.lower() in ['y', 'n', ''], "⚠️ Please enter 'y' or 'n'.")
+    if reassign_attendant is None:
+        print("Operation cancelled.")
+        pause()
+        return
+    attendants = session.execute(select(Attendant.id, Attendant.name)).all() if reassign_attendant.lower() == "y" else None
+    if attendants:
+        print("\nReassign Attendant (leave blank to skip):")
+        for aid, aname in attendants:
+            print(f"[{aid}] {aname}")
+        attendant_ids = {aid for aid, _ in attendants}
+        attendant_id_input = get_valid_input("New Attendant ID (or blank): ", lambda x: not x or (x.isdigit() and int(x) in attendant_ids), "⚠️ Invalid Attendant ID.")
+        if attendant_id_input is None:
+            print("Operation cancelled.")
+            pause()
+            return
+    elif attendants is not None:
+        print("No attendants available.")
+
     try:
         if new_name != bus.bus_name:
             bus.bus_name = new_name
         if new_capacity != bus.capacity:
             bus.capacity = new_capacity
-
-        # Optionally reassign driver/attendant
-        print("\nReassign Driver (leave blank to skip):")
-        drivers = session.query(Driver).all()
-        if drivers:
-            for d in drivers:
-                print(f"[{d.id}] {d.name}")
-            driver_id_input = get_valid_input("New Driver ID (or blank): ", lambda x: not x or (x.isdigit() and int(x) in [d.id for d in drivers]), "⚠️ Invalid Driver ID.")
-            if driver_id_input is None:
-                print("Operation cancelled.")
-                pause()
-                return
-            bus.driver = session.get(Driver, int(driver_id_input)) if driver_id_input else bus.driver
-        else:
-            print("No drivers available.")
-
-        print("\nReassign Attendant (leave blank to skip):")
-        attendants = session.query(Attendant).all()
-        if attendants:
-            for a in attendants:
-                print(f"[{a.id}] {a.name}")
-            attendant_id_input = get_valid_input("New Attendant ID (or blank): ", lambda x: not x or (x.isdigit() and int(x) in [a.id for a in attendants]), "⚠️ Invalid Attendant ID.")
-            if attendant_id_input is None:
-                print("Operation cancelled.")
-                pause()
-                return
-            bus.attendant = session.get(Attendant, int(attendant_id_input)) if attendant_id_input else bus.attendant
-        else:
-            print("No attendants available.")
+        if driver_id_input:
+            bus.driver = session.get(Driver, int(driver_id_input))
+        if attendant_id_input:
+            bus.attendant = session.get(Attendant, int(attendant_id_input))
 
         session.commit()
         print("\n✅ Bus updated successfully!")
@@ -214,41 +258,41 @@ def delete_bus(session: Session):
     print("=== Delete Bus ===\n")
     print("Type 'cancel' at any prompt to exit.\n")
 
-    buses = session.query(Bus).all()
+    # The picker only needs id/name, and the delete itself never loads the bus
+    buses = session.execute(select(Bus.id, Bus.bus_name)).all()
     if not buses:
         print("No buses found.")
         pause()
         return
 
-    for b in buses:
-        print(f"[{b.id}] {b.bus_name}")
+    for bid, bname in buses:
+        print(f"[{bid}] {bname}")
 
     # Get and validate bus ID
-    bus_id_input = get_valid_input("\nEnter Bus ID to delete: ", lambda x: x.isdigit() and int(x) in [b.id for b in buses], "⚠️ Invalid Bus ID.")
+    bus_ids = {bid for bid, _ in buses}
+    bus_id_input = get_valid_input("\nEnter Bus ID to delete: ", lambda x: x.isdigit() and int(x) in bus_ids, "⚠️ Invalid Bus ID.")
     if bus_id_input is None:
         print("Operation cancelled.")
         pause()
         return
     bus_id = int(bus_id_input)
-    bus = session.get(Bus, bus_id)
-    if not bus:
-        print("❌ Bus not found.")
-        pause()
-        return
+    bus_name = dict(buses)[bus_id]
 
     # Check for dependent students
-    if not can_delete_record(session, Student, Student.bus_id == bus.id, "student"):
+    if not can_delete_record(session, Student, Student.bus_id == bus_id, "student"):
         return
 
     # Use confirm_action for better UX
-    if not confirm_action(f"delete bus '{bus.bus_name}' (this may affect assigned students)"):
+    if not confirm_action(f"delete bus '{bus_name}' (this may affect assigned students)"):
         print("❌ Deletion cancelled.")
         pause()
         return
 
     try:
-        session.delete(bus)
+        # Single DELETE; the student check above guarantees no student still points at this bus
+        session.execute(delete(Bus).where(Bus.id == bus_id))
         session.commit()
+        session.expire_all()  # a loaded copy of the bus may still sit in the session
         print("\n✅ Bus deleted successfully.")
 
     except Exception as e:
@@ -258,6 +302,75 @@ def delete_bus(session: Session):
     pause()
 
 
+# -----------------------------------------------------------------------------
+# IMPORT BUSES FROM CSV
+# -----------------------------------------------------------------------------
+def import_buses(session: Session):
+    """
+    Bulk-load buses from a CSV file in one commit.
+
+    Columns: bus_name, plate_number, capacity, driver_id, attendant_id.
+    Plate number and the driver/attendant IDs may be left blank.
+    """
+    clear_screen()
+    print("=== Import Buses (CSV) ===\n")
+    print("Expected columns: bus_name, plate_number, capacity, driver_id, attendant_id")
+    print("Type 'cancel' at any prompt to exit.\n")
+
+    path = get_valid_input("CSV file path: ", lambda x: x.strip(), "⚠️ Path cannot be empty.")
+    if path is None:
+        print("Operation cancelled.")
+        pause()
+        return
+
+    try:
+        raw_rows = read_csv_rows(path, ("bus_name", "plate_number", "capacity", "driver_id", "attendant_id"))
+    except (IOError, ValueError) as e:
+        print(f"\n❌ Could not read file: {e}")
+        pause()
+        return
+
+    driver_ids = set(session.scalars(select(Driver.id)))
+    attendant_ids = set(session.scalars(select(Attendant.id)))
+
+    rows = []
+    for line_no, raw in enumerate(raw_rows, start=2):
+        if not raw["bus_name"] or not is_non_negative_integer(raw["capacity"]):
+            print(f"\n❌ Line {line_no}: a bus name and a non-negative integer capacity are required.")
+            pause()
+            return
+        if raw["driver_id"] and not (raw["driver_id"].isdigit() and int(raw["driver_id"]) in driver_ids):
+            print(f"\n❌ Line {line_no}: unknown driver ID '{raw['driver_id']}'.")
+            pause()
+            return
+        if raw["attendant_id"] and not (raw["attendant_id"].isdigit() and int(raw["attendant_id"]) in attendant_ids):
+            print(f"\n❌ Line {line_no}: unknown attendant ID '{raw['attendant_id']}'.")
+            pause()
+            return
+        rows.append({
+            "bus_name": raw["bus_name"],
+            "plate_number": raw["plate_number"] or None,
+            "capacity": int(raw["capacity"]),
+            "driver_id": int(raw["driver_id"]) if raw["driver_id"] else None,
+            "attendant_id": int(raw["attendant_id"]) if raw["attendant_id"] else None,
+        })
+
+    if not rows:
+        print("No rows found in file.")
+        pause()
+        return
+
+    try:
+        count = bulk_insert(session, Bus, rows)
+        print(f"\n✅ Imported {count} bus(es).")
+
+    except Exception as e:
+        session.rollback()
+        print(f"\n❌ Import failed, no buses were added: {e}")
+
+    pause()
+
+
 # -----------------------------------------------------------------------------
 # BUSES MENU CONTROLLER
 # -----------------------------------------------------------------------------
@@ -270,7 +383,8 @@ def buses_menu(session: Session):
         print("2. Add New Bus")
         print("3. Update Bus Info")
         print("4. Delete Bus")
-        print("5. Back to Main Menu")
+        print("5. Import Buses from CSV")
+        print("6. Back to Main Menu")
 
         choice = input("\nSelect option: ").strip()
 
@@ -283,6 +397,8 @@ def buses_menu(session: Session):
         elif choice == "4":
             delete_bus(session)
         elif choice == "5":
+            import_buses(session)
+        elif choice == "6":
             break
         else:
             print("⚠️ Invalid choice.")
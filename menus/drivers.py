@@ -7,10 +7,14 @@ Includes:
 - Graceful exception handling
 - Rollback protection for failed DB writes
 - Delete confirmation prompt
+- Bulk import from CSV (single commit)
 """
 
+import sys
 from utils.helpers import pause, clear_screen, get_valid_input, confirm_action, is_phone_number
-from db_models import Driver
+from utils.bulk import read_csv_rows, bulk_insert
+from db_models import Driver, Bus
+from sqlalchemy import select, update, delete
 from sqlalchemy.orm import Session
 
 
@@ -22,17 +26,21 @@ def list_drivers(session: Session):
     clear_screen()
     print("=== List of Drivers ===\n")
 
-    drivers = session.query(Driver).all()
+    drivers = session.scalars(select(Driver)).all()
     if not drivers:
         print("No drivers found.")
         pause()
         return
 
+    separator = "-" * 30
+    # Build the whole listing first and write it in one go
+    out = []
     for d in drivers:
-        print(f"[{d.id}] {d.name}")
-        print(f"  Phone: {d.phone}")
-        print(f"  License No: {d.license_number}")
-        print("-" * 30)
+        out.append(f"[{d.id}] {d.name}")
+        out.append(f"  Phone: {d.phone}")
+        out.append(f"  License No: {d.license_number}")
+        out.append(separator)
+    sys.stdout.write("\n".join(out) + "\n")
 
     pause()
 
@@ -90,7 +98,7 @@ def update_driver(session: Session):
     print("=== Update Driver ===\n")
     print("Type 'cancel' at any prompt to exit.\n")
 
-    drivers = session.query(Driver).all()
+    drivers = session.scalars(select(Driver)).all()
     if not drivers:
         print("No drivers found.")
         pause()
@@ -100,38 +108,36 @@ def update_driver(session: Session):
         print(f"[{d.id}] {d.name} ({d.phone}) - License: {d.license_number}")
 
     # Get and validate driver ID
-    driver_id_input = get_valid_input("\nEnter Driver ID to update: ", lambda x: x.isdigit() and int(x) in [d.id for d in drivers], "⚠️ Invalid Driver ID.")
+    drivers_by_id = {d.id: d for d in drivers}
+    driver_id_input = get_valid_input("\nEnter Driver ID to update: ", lambda x: x.isdigit() and int(x) in drivers_by_id, "⚠️ Invalid Driver ID.")
     if driver_id_input is None:
         print("Operation cancelled.")
         pause()
         return
-    driver_id = int(driver_id_input)
-    driver = session.get(Driver, driver_id)
-    if not driver:
-        print("❌ Driver not found.")
-        pause()
-        return
+    driver = drivers_by_id[int(driver_id_input)]
 
     print("\nLeave any field blank to keep existing value.\n")
 
     # Get and validate new name
-    new_name = get_valid_input(f"New Name [{driver.name}]: ", lambda x: x.strip() or driver.name, "⚠️ Name cannot be empty.") or driver.name
+    new_name = get_valid_input(f"New Name [{driver.name}]: ")
     if new_name is None:
         print("Operation cancelled.")
         pause()
         return
+    new_name = new_name or driver.name
     # Get and validate new phone
-    new_phone = get_valid_input(f"New Phone [{driver.phone}]: ", is_phone_number, "⚠️ Invalid phone number format.") or driver.phone
+    new_phone = get_valid_input(f"New Phone [{driver.phone}]: ", is_phone_number, "⚠️ Invalid phone number format.")
     if new_phone is None:
         print("Operation cancelled.")
         pause()
         return
     # Get and validate new license number
-    new_license = get_valid_input(f"New License No [{driver.license_number}]: ", lambda x: x.strip() or driver.license_number, "⚠️ License number cannot be empty.") or driver.license_number
+    new_license = get_valid_input(f"New License No [{driver.license_number}]: ")
     if new_license is None:
         print("Operation cancelled.")
         pause()
         return
+    new_license = new_license or driver.license_number
 
     try:
         if new_name != driver.name:
@@ -160,37 +166,39 @@ def delete_driver(session: Session):
     print("=== Delete Driver ===\n")
     print("Type 'cancel' at any prompt to exit.\n")
 
-    drivers = session.query(Driver).all()
+    # The picker only needs a few columns, and the delete itself never loads the driver
+    drivers = session.execute(select(Driver.id, Driver.name, Driver.phone)).all()
     if not drivers:
         print("No drivers found.")
         pause()
         return
 
-    for d in drivers:
-        print(f"[{d.id}] {d.name} ({d.phone})")
+    for did, dname, dphone in drivers:
+        print(f"[{did}] {dname} ({dphone})")
 
     # Get and validate driver ID
-    driver_id_input = get_valid_input("\nEnter Driver ID to delete: ", lambda x: x.isdigit() and int(x) in [d.id for d in drivers], "⚠️ Invalid Driver ID.")
+    driver_ids = {d.id for d in drivers}
+    driver_id_input = get_valid_input("\nEnter Driver ID to delete: ", lambda x: x.isdigit() and int(x) in driver_ids, "⚠️ Invalid Driver ID.")
     if driver_id_input is None:
         print("Operation cancelled.")
         pause()
         return
     driver_id = int(driver_id_input)
-    driver = session.get(Driver, driver_id)
-    if not driver:
-        print("❌ Driver not found.")
-        pause()
-        return
+    driver_name = next(d.name for d in drivers if d.id == driver_id)
 
     # Use confirm_action for better UX
-    if not confirm_action(f"delete driver '{driver.name}'"):
+    if not confirm_action(f"delete driver '{driver_name}'"):
         print("❌ Deletion cancelled.")
         pause()
         return
 
     try:
-        session.delete(driver)
+        # Unlink any bus keeping this driver, then a single DELETE, in one transaction
+        session.execute(update(Bus).where(Bus.driver_id == driver_id).values(driver_id=None))
+        session.execute(delete(Driver).where(Driver.id == driver_id))
         session.commit()
+        # Buses were unlinked by a Core UPDATE; reload them on next access
+        session.expire_all()
         print("\n✅ Driver deleted successfully.")
 
     except Exception as e:
@@ -200,6 +208,53 @@ def delete_driver(session: Session):
     pause()
 
 
+# -----------------------------------------------------------------------------
+# IMPORT DRIVERS FROM CSV
+# -----------------------------------------------------------------------------
+def import_drivers(session: Session):
+    """Bulk-load drivers from a CSV file (columns: name, phone, license_number) in one commit."""
+    clear_screen()
+    print("=== Import Drivers (CSV) ===\n")
+    print("Expected columns: name, phone, license_number")
+    print("Type 'cancel' at any prompt to exit.\n")
+
+    path = get_valid_input("CSV file path: ", lambda x: x.strip(), "⚠️ Path cannot be empty.")
+    if path is None:
+        print("Operation cancelled.")
+        pause()
+        return
+
+    try:
+        raw_rows = read_csv_rows(path, ("name", "phone", "license_number"))
+    except (IOError, ValueError) as e:
+        print(f"\n❌ Could not read file: {e}")
+        pause()
+        return
+
+    rows = []
+    for line_no, raw in enumerate(raw_rows, start=2):
+        if not raw["name"] or not is_phone_number(raw["phone"]) or not raw["license_number"]:
+            print(f"\n❌ Line {line_no}: a name, a valid phone number and a license number are required.")
+            pause()
+            return
+        rows.append({"name": raw["name"], "phone": raw["phone"], "license_number": raw["license_number"]})
+
+    if not rows:
+        print("No rows found in file.")
+        pause()
+        return
+
+    try:
+        count = bulk_insert(session, Driver, rows)
+        print(f"\n✅ Imported {count} driver(s).")
+
+    except Exception as e:
+        session.rollback()
+        print(f"\n❌ Import failed, no drivers were added: {e}")
+
+    pause()
+
+
 # -----------------------------------------------------------------------------
 # DRIVERS MENU CONTROLLER
 # -----------------------------------------------------------------------------
@@ -212,7 +267,8 @@ def drivers_menu(session: Session):
         print("2. Add New Driver")
         print("3. Update Driver Info")
         print("4. Delete Driver")
-        print("5. Back to Main Menu")
+        print("5. Import Drivers from CSV")
+        print("6. Back to Main Menu")
 
         choice = input("\nSelect option: ").strip()
 
@@ -225,6 +281,8 @@ def drivers_menu(session: Session):
         elif choice == "4":
             delete_driver(session)
         elif choice == "5":
+            import_drivers(session)
+        elif choice == "6":
             break
         else:
             print("⚠️ Invalid choice.")
@@ -7,6 +7,7 @@ Features:
 - Add new payments with validation for amounts and balance calculations.
 - Update existing payments (e.g., adjust amounts or balances).
 - Delete payments with confirmation.
+- Import many payments at once from a CSV file (single commit).
 - Integrates with Student and Term models for relational data.
 - Handles balance carried forward and ensures data integrity via constraints.
 
@@ -21,10 +22,41 @@ Error Handling:
 - Prevents invalid operations like negative amounts or duplicate weekly payments.
 """
 
-from sqlalchemy.exc import SQLAlchemyError
-from utils.helpers import pause, clear_screen
+import sys
+from sqlalchemy import select, delete
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from sqlalchemy.orm import selectinload
+from utils.helpers import pause, clear_screen, get_valid_input, is_non_negative_number, table_has_rows
+from utils.bulk import read_csv_rows, bulk_insert
 from db_models import Payment, Student, Term
 
+# Student, term and academic year for every listed payment, one IN query per relationship
+PAYMENT_LISTING_OPTIONS = (
+    selectinload(Payment.student),
+    selectinload(Payment.term).selectinload(Term.academic_year),
+)
+# Inner joins skip payments whose student, term or year row is gone; SQLite doesn't enforce the FKs
+PAYMENT_LISTING_QUERY = (
+    select(Payment)
+    .join(Payment.student)
+    .join(Payment.term)
+    .join(Term.academic_year)
+    .options(*PAYMENT_LISTING_OPTIONS)
+)
+LIST_BATCH_SIZE = 500  # rows fetched per round-trip while streaming the listing
+LIST_PAGE_SIZE = 20    # payments shown before asking whether to continue
+# SQLite names the columns instead of the constraint when uq_payment_unique fails
+_DUPLICATE_PAYMENT_MARKERS = (
+    "uq_payment_unique",
+    "payments.student_id, payments.term_id, payments.week_number",
+)
+
+
+def is_duplicate_payment_error(error):
+    """True when an IntegrityError comes from the uq_payment_unique constraint."""
+    message = str(error.orig)
+    return any(marker in message for marker in _DUPLICATE_PAYMENT_MARKERS)
+
 
 # -----------------------------------------------------------------------------
 # LIST PAYMENTS
@@ -39,23 +71,37 @@ def list_payments(session):
     clear_screen()
     print("=== List Payments ===\n")
 
-    # Fetch all payments with related student and term data
-    payments = session.query(Payment).join(Student).join(Term).all()
+    # Stream payments with related student and term data in batches instead of loading them all
+    payments = session.scalars(
+        PAYMENT_LISTING_QUERY.execution_options(yield_per=LIST_BATCH_SIZE)
+    )
 
-    if not payments:
-        print("No payments found.")
-        pause()
-        return
-
-    # Display each payment with details
+    # Display each payment with details, one page written out at a time
+    separator = "-" * 60
+    out = []
+    shown = 0
     for payment in payments:
+        # Ask before printing the next row, so a full last page isn't followed by an empty prompt
+        if shown and shown % LIST_PAGE_SIZE == 0:
+            sys.stdout.write("\n".join(out) + "\n")
+            out = []
+            if input("Press Enter for more, or 'q' to stop: ").strip().lower() == "q":
+                payments.close()  # stop fetching the remaining rows
+                break
+
         student_name = payment.student.name
         term_name = payment.term.name
         academic_year = payment.term.academic_year.name
-        print(f"ID: {payment.id} | Student: {student_name} | Term: {term_name} ({academic_year})")
-        print(f"  Week: {payment.week_number or 'N/A'} | Amount Paid: {payment.amount_paid:.2f}")
-        print(f"  Balance Carried: {payment.balance_carried:.2f} | Date: {payment.payment_date}")
-        print("-" * 60)
+        out.append(f"ID: {payment.id} | Student: {student_name} | Term: {term_name} ({academic_year})")
+        out.append(f"  Week: {payment.week_number or 'N/A'} | Amount Paid: {payment.amount_paid:.2f}")
+        out.append(f"  Balance Carried: {payment.balance_carried:.2f} | Date: {payment.payment_date}")
+        out.append(separator)
+        shown += 1
+
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
+    if not shown:
+        print("No payments found.")
 
     pause()
 
@@ -74,71 +120,69 @@ def add_payment(session):
     clear_screen()
     print("=== Add New Payment ===\n")
 
-    # List available students
-    students = session.query(Student).all()
-    if not students:
+    # Both lists are required; probe them up front so an empty terms table is
+    # reported before the student list is loaded and picked from
+    if not table_has_rows(session, Student):
         print("⚠️ No students available. Add students first.")
         pause()
         return
+    if not table_has_rows(session, Term):
+        print("⚠️ No terms available. Add terms first.")
+        pause()
+        return
+
+    # List available students
+    students = session.scalars(select(Student)).all()
 
     print("Available Students:")
     for s in students:
         bus_name = s.bus.bus_name if s.bus else "None"
         print(f"[{s.id}] {s.name} (Bus: {bus_name}, Rate: {s.monthly_rate:.2f})")
 
-    try:
-        student_id = int(input("\nEnter Student ID: ").strip())
-    except ValueError:
-        print("⚠️ Invalid Student ID.")
-        pause()
-        return
-
-    student = session.get(Student, student_id)
-    if not student:
-        print("❌ Student not found.")
+    students_by_id = {s.id: s for s in students}
+    student_id_input = get_valid_input("\nEnter Student ID: ", lambda x: x.isdigit() and int(x) in students_by_id, "⚠️ Invalid Student ID.")
+    if student_id_input is None:
+        print("Operation cancelled.")
         pause()
         return
+    student_id = int(student_id_input)
+    student = students_by_id[student_id]
 
     # List available terms
-    terms = session.query(Term).all()
-    if not terms:
-        print("⚠️ No terms available. Add terms first.")
-        pause()
-        return
+    terms = session.scalars(select(Term)).all()
 
     print("\nAvailable Terms:")
     for t in terms:
         print(f"[{t.id}] {t.name} ({t.academic_year.name})")
 
-    try:
-        term_id = int(input("\nEnter Term ID: ").strip())
-    except ValueError:
-        print("⚠️ Invalid Term ID.")
-        pause()
-        return
-
-    term = session.get(Term, term_id)
-    if not term:
-        print("❌ Term not found.")
+    term_ids = {t.id for t in terms}
+    term_id_input = get_valid_input("\nEnter Term ID: ", lambda x: x.isdigit() and int(x) in term_ids, "⚠️ Invalid Term ID.")
+    if term_id_input is None:
+        print("Operation cancelled.")
         pause()
         return
+    term_id = int(term_id_input)
 
     # Optional week number (for weekly payments)
     week_input = input("Week Number (1-20, or leave blank for general): ").strip()
     week_number = int(week_input) if week_input and week_input.isdigit() else None
-    if week_number and (week_number < 1 or week_number > 20):
+    if week_number is not None and not 1 <= week_number <= 20:
         print("⚠️ Week number must be between 1 and 20.")
         pause()
         return
 
-    # Check for duplicate weekly payment
-    existing = session.query(Payment).filter_by(
-        student_id=student_id, term_id=term_id, week_number=week_number
-    ).first()
-    if existing:
-        print("⚠️ A payment for this student, term, and week already exists.")
-        pause()
-        return
+    # Duplicate weekly payments are rejected by uq_payment_unique at commit. A UNIQUE
+    # index treats NULLs as distinct, so general (no-week) payments still need a lookup.
+    if week_number is None:
+        existing = session.scalar(
+            select(Payment.id)
+            .where(Payment.student_id == student_id, Payment.term_id == term_id, Payment.week_number.is_(None))
+            .limit(1)
+        )
+        if existing:
+            print("⚠️ A payment for this student, term, and week already exists.")
+            pause()
+            return
 
     # Input amount paid
     try:
@@ -165,8 +209,16 @@ def add_payment(session):
         )
         session.add(new_payment)
         session.commit()
+        # Set by id, so a loaded Student.payments collection doesn't include it yet
+        session.expire_all()
         print("\n✅ Payment added successfully!")
 
+    except IntegrityError as e:
+        session.rollback()
+        if is_duplicate_payment_error(e):
+            print("⚠️ A payment for this student, term, and week already exists.")
+        else:
+            print(f"\n❌ Error adding payment: {e}")
     except SQLAlchemyError as e:
         session.rollback()
         print(f"\n❌ Error adding payment: {e}")
@@ -187,13 +239,14 @@ def update_payment(session):
     clear_screen()
     print("=== Update Payment ===\n")
 
-    payments = session.query(Payment).join(Student).join(Term).all()
+    payments = session.scalars(PAYMENT_LISTING_QUERY).all()
     if not payments:
         print("No payments found.")
         pause()
         return
 
     # List payments for selection
+    payments_by_id = {p.id: p for p in payments}
     for p in payments:
         print(f"[{p.id}] {p.student.name} - {p.term.name} (Week: {p.week_number or 'N/A'}, Amount: {p.amount_paid:.2f})")
 
@@ -204,7 +257,7 @@ def update_payment(session):
         pause()
         return
 
-    payment = session.get(Payment, payment_id)
+    payment = payments_by_id.get(payment_id)
     if not payment:
         print("❌ Payment not found.")
         pause()
@@ -223,14 +276,14 @@ def update_payment(session):
         pause()
         return
 
-    # Recalculate balance if amount changed
-    if amount_input:
-        student = payment.student
-        payment.balance_carried = max(0, student.monthly_rate - new_amount)
+    # Recalculate balance only if the amount really changed (re-typing the same
+    # value is a no-op); the student was already loaded with the listing
+    if new_amount != payment.amount_paid:
+        payment.balance_carried = max(0, payment.student.monthly_rate - new_amount)
+        payment.amount_paid = new_amount
 
     # Update record
     try:
-        payment.amount_paid = new_amount
         session.commit()
         print("\n✅ Payment updated successfully!")
 
@@ -253,13 +306,14 @@ def delete_payment(session):
     clear_screen()
     print("=== Delete Payment ===\n")
 
-    payments = session.query(Payment).join(Student).join(Term).all()
+    payments = session.scalars(PAYMENT_LISTING_QUERY).all()
     if not payments:
         print("No payments found.")
         pause()
         return
 
     # List payments for selection
+    payments_by_id = {p.id: p for p in payments}
     for p in payments:
         print(f"[{p.id}] {p.student.name} - {p.term.name} (Amount: {p.amount_paid:.2f})")
 
@@ -270,7 +324,7 @@ def delete_payment(session):
         pause()
         return
 
-    payment = session.get(Payment, payment_id)
+    payment = payments_by_id.get(payment_id)
     if not payment:
         print("❌ Payment not found.")
         pause()
@@ -283,8 +337,9 @@ def delete_payment(session):
         return
 
     try:
-        session.delete(payment)
+        session.execute(delete(Payment).where(Payment.id == payment_id))
         session.commit()
+        session.expire_all()  # drop it from the session and its student's loaded payment list
         print("\n✅ Payment deleted successfully.")
 
     except SQLAlchemyError as e:
@@ -294,6 +349,100 @@ def delete_payment(session):
     pause()
 
 
+# -----------------------------------------------------------------------------
+# IMPORT PAYMENTS FROM CSV
+# -----------------------------------------------------------------------------
+def import_payments(session):
+    """
+    Bulk-load payments from a CSV file in one commit.
+
+    Columns: student_id, term_id, week_number (blank for a general payment), amount_paid.
+    Balance carried is worked out from each student's monthly rate, as in add_payment.
+    The whole file is validated first, so a bad row never leaves a partial import.
+    """
+    clear_screen()
+    print("=== Import Payments (CSV) ===\n")
+    print("Expected columns: student_id, term_id, week_number, amount_paid")
+    print("Type 'cancel' at any prompt to exit.\n")
+
+    path = get_valid_input("CSV file path: ", lambda x: x.strip(), "⚠️ Path cannot be empty.")
+    if path is None:
+        print("Operation cancelled.")
+        pause()
+        return
+
+    try:
+        raw_rows = read_csv_rows(path, ("student_id", "term_id", "week_number", "amount_paid"))
+    except (IOError, ValueError) as e:
+        print(f"\n❌ Could not read file: {e}")
+        pause()
+        return
+
+    # Lookups for validation, each fetched once for the whole file
+    rates = dict(session.execute(select(Student.id, Student.monthly_rate)).all())
+    term_ids = set(session.scalars(select(Term.id)).all())
+    # NULL weeks slip past the unique constraint, so general payments are checked here
+    seen = set(session.execute(
+        select(Payment.student_id, Payment.term_id, Payment.week_number).where(Payment.week_number.is_(None))
+    ).all())
+
+    rows = []
+    for line_no, raw in enumerate(raw_rows, start=2):
+        student_id = int(raw["student_id"]) if raw["student_id"].isdigit() else None
+        term_id = int(raw["term_id"]) if raw["term_id"].isdigit() else None
+        if student_id not in rates or term_id not in term_ids:
+            print(f"\n❌ Line {line_no}: unknown student or term ID.")
+            pause()
+            return
+        week_number = int(raw["week_number"]) if raw["week_number"].isdigit() else None
+        if raw["week_number"] and not (week_number and 1 <= week_number <= 20):
+            print(f"\n❌ Line {line_no}: week number must be between 1 and 20 (or blank).")
+            pause()
+            return
+        if not is_non_negative_number(raw["amount_paid"]):
+            print(f"\n❌ Line {line_no}: amount must be a non-negative number.")
+            pause()
+            return
+        key = (student_id, term_id, week_number)
+        if key in seen:
+            print(f"\n❌ Line {line_no}: a payment for this student, term, and week already exists.")
+            pause()
+            return
+        seen.add(key)
+
+        amount_paid = float(raw["amount_paid"])
+        rows.append({
+            "student_id": student_id,
+            "term_id": term_id,
+            "week_number": week_number,
+            "amount_paid": amount_paid,
+            "balance_carried": max(0, rates[student_id] - amount_paid),
+        })
+
+    if not rows:
+        print("No rows found in file.")
+        pause()
+        return
+
+    try:
+        count = bulk_insert(session, Payment, rows)
+        # Inserted by id, so loaded Student.payments collections don't include them yet
+        session.expire_all()
+        print(f"\n✅ Imported {count} payment(s).")
+
+    except IntegrityError as e:
+        session.rollback()
+        if is_duplicate_payment_error(e):
+            print("\n❌ Import failed, no payments were added: a payment for one of these students, terms, and weeks already exists.")
+        else:
+            print(f"\n❌ Import failed, no payments were added: {e}")
+    except SQLAlchemyError as e:
+        session.rollback()
+        print(f"\n❌ Import failed, no payments were added: {e}")
+
+    pause()
+
+
 # -----------------------------------------------------------------------------
 # PAYMENTS MENU CONTROLLER
 # -----------------------------------------------------------------------------
@@ -301,7 +450,7 @@ def payments_menu(session):
     """
     Main CLI navigation menu for managing payments.
 
-    Provides options to list, add, update, delete payments, or return to main menu.
+    Provides options to list, add, update, delete, import payments, or return to main menu.
     """
     while True:
         clear_screen()
@@ -310,7 +459,8 @@ def payments_menu(session):
         print("2. Add New Payment")
         print("3. Update Payment")
         print("4. Delete Payment")
-        print("5. Back to Main Menu")
+        print("5. Import Payments from CSV")
+        print("6. Back to Main Menu")
 
         choice = input("\nSelect option: ").strip()
 
@@ -323,6 +473,8 @@ def payments_menu(session):
         elif choice == "4":
             delete_payment(session)
         elif choice == "5":
+            import_payments(session)
+        elif choice == "6":
             break
         else:
             print("⚠️ Invalid choice.")
@@ -22,9 +22,48 @@ Error Handling:
 """
 
 import csv
+import os
+from sqlalchemy import func
+from sqlalchemy.orm import joinedload
 from utils.helpers import pause, clear_screen
+from menus.settings import get_setting
+from menus.buses import bus_names_by_id
 from db_models import Student, Payment, Bus, Term, AcademicYear
 
+EXPORT_BATCH_SIZE = 1000  # rows fetched per round-trip while streaming a CSV export
+EXPORT_BUFFER_SIZE = 1 << 20  # 1 MiB file buffer so large exports go out in few write() calls
+
+
+# -----------------------------------------------------------------------------
+# REPORT QUERIES
+# -----------------------------------------------------------------------------
+def student_payment_totals(session) -> dict:
+    """Return {student_id: total amount paid} computed with one GROUP BY query."""
+    return dict(
+        session.query(Payment.student_id, func.coalesce(func.sum(Payment.amount_paid), 0.0))
+        .group_by(Payment.student_id)
+        .all()
+    )
+
+
+def bus_student_counts(session) -> dict:
+    """Return {bus_id: number of students} computed with one GROUP BY query."""
+    return dict(
+        session.query(Student.bus_id, func.count(Student.id))
+        .group_by(Student.bus_id)
+        .all()
+    )
+
+
+def payment_report_rows(session):
+    """Query of (student name, term name, amount paid, balance carried) rows, one per payment."""
+    return (
+        session.query(Student.name, Term.name, Payment.amount_paid, Payment.balance_carried)
+        .select_from(Payment)
+        .join(Student, Payment.student_id == Student.id)
+        .join(Term, Payment.term_id == Term.id)
+    )
+
 
 # -----------------------------------------------------------------------------
 # GENERATE STUDENT REPORT
@@ -39,25 +78,30 @@ def generate_student_report(session):
     clear_screen()
     print("=== Student Report ===\n")
 
-    # Fetch students with related bus and payment data
-    students = session.query(Student).all()
+    # Plain columns only; bus names come from a small id -> name map instead of a join
+    students = session.query(Student.id, Student.name, Student.bus_id, Student.monthly_rate).all()
     if not students:
         print("No students found.")
         pause()
         return
 
+    # Payment totals per student, summed in SQL rather than by loading every Payment
+    totals = student_payment_totals(session)
+    bus_names = bus_names_by_id(session)
+
     # Display report in console
     print("Student Report:\n")
     for student in students:
-        bus_name = student.bus.bus_name if student.bus else "Unassigned"
-        total_payments = sum(p.amount_paid for p in student.payments) if student.payments else 0.0
+        bus_name = bus_names.get(student.bus_id, "Unassigned")
+        total_payments = totals.get(student.id, 0.0)
         print(f"Name: {student.name} | Bus: {bus_name} | Rate: {student.monthly_rate:.2f} | Total Paid: {total_payments:.2f}")
 
     # Option to export to CSV
     export = input("\nExport to CSV? (y/n): ").strip().lower()
     if export == "y":
-        export_students_to_csv(students)
-        print("Report exported to 'student_report.csv'.")
+        path = export_students_to_csv(session)
+        if path:
+            print(f"Report exported to '{path}'.")
 
     pause()
 
@@ -75,8 +119,8 @@ def generate_payment_report(session):
     clear_screen()
     print("=== Payment Report ===\n")
 
-    # Fetch payments with related student and term data
-    payments = session.query(Payment).join(Student).join(Term).all()
+    # Fetch only the four printed columns; no Payment, Student or Term objects are built
+    payments = payment_report_rows(session).all()
     if not payments:
         print("No payments found.")
         pause()
@@ -84,20 +128,19 @@ def generate_payment_report(session):
 
     # Display report in console
     print("Payment Report:\n")
-    total_collected = 0.0
-    for payment in payments:
-        student_name = payment.student.name
-        term_name = payment.term.name
-        print(f"Student: {student_name} | Term: {term_name} | Amount: {payment.amount_paid:.2f} | Balance: {payment.balance_carried:.2f}")
-        total_collected += payment.amount_paid
+    for student_name, term_name, amount_paid, balance_carried in payments:
+        print(f"Student: {student_name} | Term: {term_name} | Amount: {amount_paid:.2f} | Balance: {balance_carried:.2f}")
 
+    # Summed by the database rather than accumulated in the display loop
+    total_collected = session.query(func.coalesce(func.sum(Payment.amount_paid), 0.0)).scalar()
     print(f"\nTotal Collected: {total_collected:.2f}")
 
     # Option to export to CSV
     export = input("\nExport to CSV? (y/n): ").strip().lower()
     if export == "y":
-        export_payments_to_csv(payments)
-        print("Report exported to 'payment_report.csv'.")
+        path = export_payments_to_csv(session)
+        if path:
+            print(f"Report exported to '{path}'.")
 
     pause()
 
@@ -115,27 +158,30 @@ def generate_bus_report(session):
     clear_screen()
     print("=== Bus Report ===\n")
 
-    # Fetch buses with related driver, attendant, and students
-    buses = session.query(Bus).all()
+    # Fetch buses with their driver and attendant; students are only counted, never loaded
+    buses = session.query(Bus).options(joinedload(Bus.driver), joinedload(Bus.attendant)).all()
     if not buses:
         print("No buses found.")
         pause()
         return
 
+    counts = bus_student_counts(session)
+
     # Display report in console
     print("Bus Report:\n")
     for bus in buses:
         driver_name = bus.driver.name if bus.driver else "Unassigned"
         attendant_name = bus.attendant.name if bus.attendant else "Unassigned"
-        student_count = len(bus.students) if bus.students else 0
+        student_count = counts.get(bus.id, 0)
         utilization = (student_count / bus.capacity * 100) if bus.capacity and bus.capacity > 0 else 0
         print(f"Bus: {bus.bus_name} | Capacity: {bus.capacity} | Students: {student_count} ({utilization:.1f}%) | Driver: {driver_name} | Attendant: {attendant_name}")
 
     # Option to export to CSV
     export = input("\nExport to CSV? (y/n): ").strip().lower()
     if export == "y":
-        export_buses_to_csv(buses)
-        print("Report exported to 'bus_report.csv'.")
+        path = export_buses_to_csv(session)
+        if path:
+            print(f"Report exported to '{path}'.")
 
     pause()
 
@@ -143,58 +189,104 @@ def generate_bus_report(session):
 # -----------------------------------------------------------------------------
 # EXPORT FUNCTIONS
 # -----------------------------------------------------------------------------
-def export_students_to_csv(students):
+def export_file_path(session, filename: str) -> str:
+    """Resolve an export file inside the configured csv_export_path (current directory if unset)."""
+    base = get_setting(session, "csv_export_path", "") or "."
+    os.makedirs(base, exist_ok=True)
+    return os.path.join(base, filename)
+
+
+def export_students_to_csv(session):
     """
     Export student data to a CSV file.
 
     Includes fields like name, bus, rate, and total payments.
+    Students are streamed in batches and written as they arrive.
+    Returns the file path, or None if the file could not be written.
     """
+    totals = student_payment_totals(session)
+    bus_names = bus_names_by_id(session)
+    students = (
+        session.query(Student.id, Student.name, Student.bus_id, Student.monthly_rate)
+        .yield_per(EXPORT_BATCH_SIZE)
+    )
     try:
-        with open("student_report.csv", "w", newline="") as file:
+        path = export_file_path(session, "student_report.csv")
+        with open(path, "w", newline="", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as file:
             writer = csv.writer(file)
             writer.writerow(["Name", "Bus", "Monthly Rate", "Total Payments"])
-            for student in students:
-                bus_name = student.bus.bus_name if student.bus else "Unassigned"
-                total_payments = sum(p.amount_paid for p in student.payments) if student.payments else 0.0
-                writer.writerow([student.name, bus_name, student.monthly_rate, total_payments])
+            writer.writerows(
+                (student.name, bus_names.get(student.bus_id, "Unassigned"), student.monthly_rate, totals.get(student.id, 0.0))
+                for student in students
+            )
+            # One explicit sync once everything is written, rather than relying on close()
+            file.flush()
+            os.fsync(file.fileno())
+        return path
     except IOError as e:
         print(f"Error exporting to CSV: {e}")
+        return None
 
 
-def export_payments_to_csv(payments):
+def export_payments_to_csv(session):
     """
     Export payment data to a CSV file.
 
     Includes fields like student, term, amount, and balance.
+    Payments are streamed in batches and written as they arrive.
+    Returns the file path, or None if the file could not be written.
     """
+    payments = payment_report_rows(session).yield_per(EXPORT_BATCH_SIZE)
     try:
-        with open("payment_report.csv", "w", newline="") as file:
+        path = export_file_path(session, "payment_report.csv")
+        with open(path, "w", newline="", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as file:
             writer = csv.writer(file)
             writer.writerow(["Student", "Term", "Amount Paid", "Balance Carried"])
-            for payment in payments:
-                writer.writerow([payment.student.name, payment.term.name, payment.amount_paid, payment.balance_carried])
+            # Rows already come back in column order
+            writer.writerows(payments)
+            file.flush()
+            os.fsync(file.fileno())
+        return path
     except IOError as e:
         print(f"Error exporting to CSV: {e}")
+        return None
+
+
+def _bus_export_row(bus, counts):
+    """Build one bus_report.csv row (counts is the {bus_id: students} map from bus_student_counts)."""
+    student_count = counts.get(bus.id, 0)
+    utilization = (student_count / bus.capacity * 100) if bus.capacity and bus.capacity > 0 else 0
+    driver_name = bus.driver.name if bus.driver else "Unassigned"
+    attendant_name = bus.attendant.name if bus.attendant else "Unassigned"
+    return (bus.bus_name, bus.capacity, student_count, f"{utilization:.1f}", driver_name, attendant_name)
 
 
-def export_buses_to_csv(buses):
+def export_buses_to_csv(session):
     """
     Export bus data to a CSV file.
 
     Includes fields like bus name, capacity, utilization, driver, and attendant.
+    Buses are streamed in batches and written as they arrive.
+    Returns the file path, or None if the file could not be written.
     """
+    counts = bus_student_counts(session)
+    buses = (
+        session.query(Bus)
+        .options(joinedload(Bus.driver), joinedload(Bus.attendant))
+        .yield_per(EXPORT_BATCH_SIZE)
+    )
     try:
-        with open("bus_report.csv", "w", newline="") as file:
+        path = export_file_path(session, "bus_report.csv")
+        with open(path, "w", newline="", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as file:
             writer = csv.writer(file)
             writer.writerow(["Bus Name", "Capacity", "Student Count", "Utilization %", "Driver", "Attendant"])
-            for bus in buses:
-                student_count = len(bus.students) if bus.students else 0
-                utilization = (student_count / bus.capacity * 100) if bus.capacity and bus.capacity > 0 else 0
-                driver_name = bus.driver.name if bus.driver else "Unassigned"
-                attendant_name = bus.attendant.name if bus.attendant else "Unassigned"
-                writer.writerow([bus.bus_name, bus.capacity, student_count, f"{utilization:.1f}", driver_name, attendant_name])
+            writer.writerows(_bus_export_row(bus, counts) for bus in buses)
+            file.flush()
+            os.fsync(file.fileno())
+        return path
     except IOError as e:
         print(f"Error exporting to CSV: {e}")
+        return None
 
 
 # -----------------------------------------------------------------------------
@@ -12,33 +12,63 @@ All destructive actions have explicit confirmation prompts.
 """
 
 from utils.helpers import pause, clear_screen
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
+from sqlalchemy.schema import DropTable
 from db_models import (
-    Base, init_engine, create_session, create_all_tables,
+    Base, init_engine, create_session, create_all_tables, stamp_schema_version,
     AcademicYear, Term, Driver, Attendant, Bus, Student, Payment
 )
 from db_models import SystemSetting  # <-- new model (add this to db_models.py)
-from datetime import date, datetime
+from datetime import date
+from functools import lru_cache
 
 
 # -----------------------------------------------------------------------------
 # SYSTEM SETTING HELPERS
 # -----------------------------------------------------------------------------
+# session.info key for a dict of key -> value for every stored setting, loaded
+# with one SELECT on first use. Kept on the session so it lives and dies with
+# the session that filled it; set_setting keeps it current.
+SETTINGS_CACHE_KEY = "settings_cache"
+
+
+def invalidate_settings_cache(session: Session):
+    """Forget the session's cached settings so the next get_setting reloads them."""
+    session.info.pop(SETTINGS_CACHE_KEY, None)
+
+
 def get_setting(session: Session, key: str, default=None):
     """Retrieve a system setting by key, or return default if missing."""
-    setting = session.query(SystemSetting).filter_by(key=key).first()
-    return setting.value if setting else default
+    cache = session.info.get(SETTINGS_CACHE_KEY)
+    if cache is None:
+        cache = dict(session.query(SystemSetting.key, SystemSetting.value).all())
+        session.info[SETTINGS_CACHE_KEY] = cache
+    return cache.get(key, default)
 
 
-def set_setting(session: Session, key: str, value: str):
-    """Create or update a system setting (stored as string)."""
-    setting = session.query(SystemSetting).filter_by(key=key).first()
+def set_setting(session: Session, key: str, value: str, commit: bool = True):
+    """
+    Create or update a system setting (stored as string).
+
+    Pass commit=False to only flush, when the caller commits several writes together.
+    The cache is only updated once the value is committed; a flush just drops it,
+    so a later rollback can't leave an uncommitted value cached.
+    """
+    setting = session.get(SystemSetting, key)
     if setting:
         setting.value = str(value)
     else:
         setting = SystemSetting(key=key, value=str(value))
         session.add(setting)
-    session.commit()
+    if commit:
+        session.commit()
+        cache = session.info.get(SETTINGS_CACHE_KEY)
+        if cache is not None:
+            cache[key] = str(value)
+    else:
+        session.flush()
+        invalidate_settings_cache(session)
 
 
 def check_day_passed(session: Session):
@@ -48,29 +78,43 @@ def check_day_passed(session: Session):
     Returns:
         bool: True if a day has passed, False otherwise.
     """
+    # Stored as a date ordinal (days since 0001-01-01), so no date parsing is needed
+    today = date.today().toordinal()
     last_run_str = get_setting(session, "last_run_date")
     if not last_run_str:
         # First run, set the current date
-        set_setting(session, "last_run_date", str(date.today()))
+        set_setting(session, "last_run_date", today)
         return False
 
     try:
-        last_run_date = datetime.strptime(last_run_str, "%Y-%m-%d").date()
-        current_date = date.today()
-        if current_date > last_run_date:
-            set_setting(session, "last_run_date", str(current_date))
-            return True
-        return False
+        last_run = int(last_run_str)
     except ValueError:
-        # Invalid date format, reset to current date
-        set_setting(session, "last_run_date", str(date.today()))
-        return False
+        # Databases written before the switch hold an ISO date string
+        try:
+            last_run = date.fromisoformat(last_run_str).toordinal()
+        except ValueError:
+            # Invalid date format, reset to current date
+            set_setting(session, "last_run_date", today)
+            return False
+
+    if today > last_run:
+        set_setting(session, "last_run_date", today)
+        return True
+    return False
 
 
 def display_day_passed_notification(session: Session):
     """
     Display a notification if a day has passed since the last run and the feature is enabled.
+
+    Safe to call on every menu redraw: the settings lookups run at most once per day per session.
     """
+    _notify_day_passed(session, date.today().toordinal())
+
+
+@lru_cache(maxsize=1)
+def _notify_day_passed(session: Session, _day_ordinal: int):
+    """Does the work for display_day_passed_notification; cached per (session, day)."""
     # Check if day detection is enabled
     day_detection_enabled = get_setting(session, "day_detection_enabled", "true").lower() == "true"
 
@@ -154,6 +198,25 @@ def configure_system_settings(session: Session):
 # -----------------------------------------------------------------------------
 # DATA WIPE (SAFETY GUARDED)
 # -----------------------------------------------------------------------------
+# Children before parents, worked out once at import
+TABLES_IN_DROP_ORDER = tuple(reversed(Base.metadata.sorted_tables))
+
+
+def rebuild_schema(engine):
+    """
+    Drop and recreate every table in one transaction.
+
+    Unlike drop_all/create_all this issues the DDL directly instead of first
+    checking, table by table, whether each one exists. The fresh settings
+    table is stamped with the schema version, so the next start skips create_all.
+    """
+    with engine.begin() as conn:
+        for table in TABLES_IN_DROP_ORDER:
+            conn.execute(DropTable(table, if_exists=True))
+        Base.metadata.create_all(conn, checkfirst=False)
+        stamp_schema_version(conn)
+
+
 def wipe_all_data(engine):
     """
     Completely removes all data and reinitializes tables.
@@ -169,8 +232,7 @@ def wipe_all_data(engine):
         return
 
     print("\nWiping database...")
-    Base.metadata.drop_all(engine)
-    create_all_tables(engine)
+    rebuild_schema(engine)
 
     print("✅ All data cleared successfully.")
     pause()
@@ -179,6 +241,12 @@ def wipe_all_data(engine):
 # -----------------------------------------------------------------------------
 # DEMO DATA INITIALIZATION
 # -----------------------------------------------------------------------------
+def _insert_returning_ids(session: Session, model, rows: list) -> list:
+    """Insert rows with one multi-row INSERT and return the new IDs in the same order."""
+    stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+    return session.scalars(stmt, rows).all()
+
+
 def initialize_demo_data(session: Session, engine):
     """
     Wipes all data, recreates tables, and inserts sample demo data.
@@ -195,42 +263,57 @@ def initialize_demo_data(session: Session, engine):
 
     # Recreate database schema
     print("\nRebuilding database schema...")
-    Base.metadata.drop_all(engine)
-    create_all_tables(engine)
+    rebuild_schema(engine)
+    # Instances and settings loaded before the rebuild no longer match any row
+    session.expunge_all()
+    invalidate_settings_cache(session)
 
     print("Inserting demo data...")
 
+    # One multi-row INSERT per table, parents first, each tier using the IDs of the one before
     # === Academic year and term ===
-    year = AcademicYear(name="2024/2025", start_date=date(2024, 1, 1), end_date=date(2024, 12, 31))
-    term = Term(name="Term 1", start_date=date(2024, 1, 10), end_date=date(2024, 4, 5), academic_year=year)
+    [year_id] = _insert_returning_ids(session, AcademicYear, [
+        {"name": "2024/2025", "start_date": date(2024, 1, 1), "end_date": date(2024, 12, 31)},
+    ])
+    [term_id] = _insert_returning_ids(session, Term, [
+        {"name": "Term 1", "start_date": date(2024, 1, 10), "end_date": date(2024, 4, 5), "academic_year_id": year_id},
+    ])
 
     # === Drivers ===
-    driver1 = Driver(name="John Doe", phone="0700123456", license_number="DRV001", assigned=True)
-    driver2 = Driver(name="Jane Smith", phone="0700234567", license_number="DRV002", assigned=False)
+    driver1, driver2 = _insert_returning_ids(session, Driver, [
+        {"name": "John Doe", "phone": "0700123456", "license_number": "DRV001", "assigned": True},
+        {"name": "Jane Smith", "phone": "0700234567", "license_number": "DRV002", "assigned": False},
+    ])
 
     # === Attendants ===
-    att1 = Attendant(name="Samuel Att", phone="0711122233")
-    att2 = Attendant(name="Grace K", phone="0711223344")
+    att1, att2 = _insert_returning_ids(session, Attendant, [
+        {"name": "Samuel Att", "phone": "0711122233"},
+        {"name": "Grace K", "phone": "0711223344"},
+    ])
 
     # === Buses ===
-    bus1 = Bus(bus_name="Bus A", plate_number="KAA 123A", capacity=40, driver=driver1, attendant=att1)
-    bus2 = Bus(bus_name="Bus B", plate_number="KBB 456B", capacity=35, driver=driver2, attendant=att2)
+    bus1, bus2 = _insert_returning_ids(session, Bus, [
+        {"bus_name": "Bus A", "plate_number": "KAA 123A", "capacity": 40, "driver_id": driver1, "attendant_id": att1},
+        {"bus_name": "Bus B", "plate_number": "KBB 456B", "capacity": 35, "driver_id": driver2, "attendant_id": att2},
+    ])
 
     # === Students ===
-    s1 = Student(name="Alice Brown", parent_contact="0700998877", address="Hillview", bus=bus1, monthly_rate=50.0)
-    s2 = Student(name="Brian Green", parent_contact="0700887766", address="Westlane", bus=bus2, monthly_rate=60.0)
-    s3 = Student(name="Chloe White", parent_contact="0700665544", address="Eastville", bus=bus1, monthly_rate=45.0)
+    s1, s2, s3 = _insert_returning_ids(session, Student, [
+        {"name": "Alice Brown", "parent_contact": "0700998877", "address": "Hillview", "bus_id": bus1, "monthly_rate": 50.0},
+        {"name": "Brian Green", "parent_contact": "0700887766", "address": "Westlane", "bus_id": bus2, "monthly_rate": 60.0},
+        {"name": "Chloe White", "parent_contact": "0700665544", "address": "Eastville", "bus_id": bus1, "monthly_rate": 45.0},
+    ])
 
     # === Payments ===
-    p1 = Payment(student=s1, term=term, week_number=1, amount_paid=25.0, balance_carried=25.0)
-    p2 = Payment(student=s2, term=term, week_number=1, amount_paid=30.0, balance_carried=30.0)
-
-    session.add_all([year, term, driver1, driver2, att1, att2, bus1, bus2, s1, s2, s3, p1, p2])
+    session.execute(insert(Payment), [
+        {"student_id": s1, "term_id": term_id, "week_number": 1, "amount_paid": 25.0, "balance_carried": 25.0},
+        {"student_id": s2, "term_id": term_id, "week_number": 1, "amount_paid": 30.0, "balance_carried": 30.0},
+    ])
 
-    # Set default settings
-    set_setting(session, "default_monthly_rate", 50.0)
-    set_setting(session, "csv_export_path", "exports/")
-    set_setting(session, "day_detection_enabled", "true")
+    # Set default settings; committed together with the demo rows below
+    set_setting(session, "default_monthly_rate", 50.0, commit=False)
+    set_setting(session, "csv_export_path", "exports/", commit=False)
+    set_setting(session, "day_detection_enabled", "true", commit=False)
 
     session.commit()
     print("\n✅ Demo data initialized successfully!")
@@ -258,6 +341,9 @@ def settings_menu(session: Session):
             initialize_demo_data(session, engine)
         elif choice == "2":
             wipe_all_data(engine)
+            # Tables were rebuilt underneath the session; forget old instances and settings
+            session.expunge_all()
+            invalidate_settings_cache(session)
         elif choice == "3":
             configure_system_settings(session)
         elif choice == "4":
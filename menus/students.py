@@ -13,8 +13,57 @@ Handles input validation, safe rollbacks, and relational integrity.
 """
 
 from sqlalchemy.exc import SQLAlchemyError
-from utils.helpers import clear_screen, pause, get_valid_input, is_non_negative_number, is_phone_number, confirm_action, search_list, can_delete_record
+from utils.helpers import clear_screen, pause, get_valid_input, is_non_negative_number, is_optional_phone_number, confirm_action, can_delete_record, table_has_rows
 from db_models import Student, Bus, Payment
+from menus.buses import bus_names_by_id
+
+LIST_PAGE_SIZE = 50  # students shown per screen in listings
+
+
+# -----------------------------------------------------------------------------
+# PAGING
+# -----------------------------------------------------------------------------
+def browse_pages(fetch_page, print_row, finish_prompt=None) -> bool:
+    """
+    Print rows a page at a time with n/p/q navigation (keyset pagination).
+
+    Args:
+        fetch_page (callable): fetch_page(after_id, limit) returns up to `limit` rows with
+            id > after_id, ordered by id. Each row must expose an `id`.
+        print_row (callable): Prints one row.
+        finish_prompt (str): Optional prompt shown when everything fits on one page.
+
+    Returns:
+        bool: False if there were no rows at all, True otherwise.
+    """
+    page_starts = [0]  # after_id of every page reached so far; the last one is on screen
+    while True:
+        # One extra row tells us whether a next page exists without a COUNT
+        rows = fetch_page(page_starts[-1], LIST_PAGE_SIZE + 1)
+        has_next = len(rows) > LIST_PAGE_SIZE
+        rows = rows[:LIST_PAGE_SIZE]
+        if not rows and len(page_starts) == 1:
+            return False
+
+        for row in rows:
+            print_row(row)
+
+        has_prev = len(page_starts) > 1
+        if not has_next and not has_prev:
+            if finish_prompt:
+                input(finish_prompt)
+            return True
+
+        nav = (["n = next page"] if has_next else []) + (["p = previous page"] if has_prev else [])
+        valid = {"q", ""} | ({"n"} if has_next else set()) | ({"p"} if has_prev else set())
+        choice = get_valid_input(f"\n{', '.join(nav)}, q = done: ", lambda x: x.lower() in valid, "⚠️ Invalid choice.")
+        if choice is None or choice.lower() in ("q", ""):
+            return True
+        if choice.lower() == "n":
+            page_starts.append(rows[-1].id)
+        else:
+            page_starts.pop()
+        print()
 
 
 # -----------------------------------------------------------------------------
@@ -23,9 +72,7 @@ from db_models import Student, Bus, Payment
 def list_students(session):
     """Display all students with search functionality."""
     clear_screen()
-    all_students = session.query(Student).all()
-
-    if not all_students:
+    if not table_has_rows(session, Student):
         print("No students found.\n")
         pause()
         return
@@ -36,16 +83,18 @@ def list_students(session):
         print("Operation cancelled.")
         pause()
         return
-    students = search_list(all_students, search_term, key_func=lambda s: s.name)
 
-    if not students:
-        print("No students match the search term.\n")
-        pause()
-        return
-
-    print("=== STUDENT LIST ===\n")
-    for s in students:
-        bus_name = s.bus.bus_name if s.bus else "None"
+    # Plain columns plus an id -> name map for buses; no Student or Bus objects are built
+    bus_names = bus_names_by_id(session)
+    query = session.query(
+        Student.id, Student.name, Student.bus_id, Student.monthly_rate,
+        Student.is_active, Student.address, Student.parent_contact,
+    ).order_by(Student.id)
+    if search_term:
+        query = query.filter(Student.name.icontains(search_term, autoescape=True))
+
+    def print_student(s):
+        bus_name = bus_names.get(s.bus_id, "None")
         status = "Active" if s.is_active else "Inactive"
         print(
             f"ID: {s.id} | Name: {s.name} | Bus: {bus_name} | "
@@ -53,7 +102,15 @@ def list_students(session):
         )
         print(f"Address: {s.address or '-'} | Contact: {s.parent_contact or '-'}\n")
 
-    pause()
+    print("=== STUDENT LIST ===\n")
+    shown = browse_pages(
+        lambda after_id, limit: query.filter(Student.id > after_id).limit(limit).all(),
+        print_student,
+        "Press Enter to continue...",
+    )
+    if not shown:
+        print("No students match the search term.\n")
+        pause()
 
 
 def add_student(session):
@@ -70,7 +127,7 @@ def add_student(session):
         return
 
     # Get and validate parent contact (optional phone validation)
-    parent_contact = get_valid_input("Parent Contact (optional): ", lambda x: not x or is_phone_number(x), "⚠️ Invalid phone number format.")
+    parent_contact = get_valid_input("Parent Contact (optional): ", is_optional_phone_number, "⚠️ Invalid phone number format.")
     if parent_contact is None:
         print("Operation cancelled.")
         pause()
@@ -92,7 +149,8 @@ def add_student(session):
     monthly_rate = float(monthly_rate_input)
 
     # --- Assign bus ---
-    buses = session.query(Bus).all()
+    # The picker only needs these columns, so no Bus objects are loaded
+    buses = session.query(Bus.id, Bus.bus_name, Bus.plate_number).all()
     if not buses:
         print("⚠️ No buses available. Add a bus first.")
         pause()
@@ -103,7 +161,8 @@ def add_student(session):
         print(f"{b.id}. {b.bus_name} ({b.plate_number})")
 
     # Get and validate bus ID
-    bus_id_input = get_valid_input("Enter Bus ID (or leave blank for none): ", lambda x: not x or (x.isdigit() and int(x) in [b.id for b in buses]), "⚠️ Invalid Bus ID.")
+    bus_ids = {b.id for b in buses}
+    bus_id_input = get_valid_input("Enter Bus ID (or leave blank for none): ", lambda x: not x or (x.isdigit() and int(x) in bus_ids), "⚠️ Invalid Bus ID.")
     if bus_id_input is None:
         print("Operation cancelled.")
         pause()
@@ -121,6 +180,8 @@ def add_student(session):
         )
         session.add(new_student)
         session.commit()
+        # Set by bus_id, so loaded Bus.students collections don't include it yet
+        session.expire_all()
         print("\n✅ Student added successfully.")
     except SQLAlchemyError as e:
         session.rollback()
@@ -135,29 +196,34 @@ def update_student(session):
     print("=== UPDATE STUDENT ===\n")
     print("Type 'cancel' at any prompt to exit.\n")
 
-    students = session.query(Student).all()
-    if not students:
+    # List from plain columns, a page at a time; only the student picked below is loaded as an object
+    query = (
+        session.query(Student.id, Student.name, Bus.bus_name)
+        .outerjoin(Bus, Student.bus_id == Bus.id)
+        .order_by(Student.id)
+    )
+    listed_ids = set()
+
+    def print_student(s):
+        listed_ids.add(s.id)
+        print(f"{s.id}. {s.name} (Bus: {s.bus_name or 'None'})")
+
+    shown = browse_pages(
+        lambda after_id, limit: query.filter(Student.id > after_id).limit(limit).all(),
+        print_student,
+    )
+    if not shown:
         print("⚠️ No students available.")
         pause()
         return
 
-    # --- List all students ---
-    for s in students:
-        print(f"{s.id}. {s.name} (Bus: {s.bus.bus_name if s.bus else 'None'})")
-
-    # Get and validate student ID
-    student_id_input = get_valid_input("\nEnter Student ID to update: ", lambda x: x.isdigit() and int(x) in [s.id for s in students], "⚠️ Invalid Student ID.")
+    # Get and validate student ID against the students actually listed
+    student_id_input = get_valid_input("\nEnter Student ID to update: ", lambda x: x.isdigit() and int(x) in listed_ids, "⚠️ Invalid Student ID.")
     if student_id_input is None:
         print("Operation cancelled.")
         pause()
         return
-    student_id = int(student_id_input)
-
-    student = session.get(Student, student_id)
-    if not student:
-        print("⚠️ Student not found.")
-        pause()
-        return
+    student = session.get(Student, int(student_id_input))
 
     # --- Editable fields ---
     print("\nLeave blank to keep current value. Type 'cancel' to exit.\n")
@@ -166,7 +232,7 @@ def update_student(session):
         print("Operation cancelled.")
         pause()
         return
-    new_contact = get_valid_input(f"Parent Contact [{student.parent_contact or '-'}]: ", lambda x: not x or is_phone_number(x), "⚠️ Invalid phone number format.") or student.parent_contact
+    new_contact = get_valid_input(f"Parent Contact [{student.parent_contact or '-'}]: ", is_optional_phone_number, "⚠️ Invalid phone number format.") or student.parent_contact
     if new_contact is None:
         print("Operation cancelled.")
         pause()
@@ -184,11 +250,12 @@ def update_student(session):
     new_rate = float(new_rate_input) if new_rate_input else student.monthly_rate
 
     # --- Bus reassignment ---
-    buses = session.query(Bus).all()
+    buses = session.query(Bus.id, Bus.bus_name).all()
     print("\nAvailable Buses:")
     for b in buses:
         print(f"{b.id}. {b.bus_name}")
-    bus_id_input = get_valid_input(f"New Bus ID (current {student.bus_id or 'None'}): ", lambda x: not x or (x.isdigit() and int(x) in [b.id for b in buses]), "⚠️ Invalid Bus ID.")
+    bus_ids = {b.id for b in buses}
+    bus_id_input = get_valid_input(f"New Bus ID (current {student.bus_id or 'None'}): ", lambda x: not x or (x.isdigit() and int(x) in bus_ids), "⚠️ Invalid Bus ID.")
     if bus_id_input is None:
         print("Operation cancelled.")
         pause()
@@ -203,6 +270,8 @@ def update_student(session):
         student.monthly_rate = new_rate
         student.bus_id = new_bus_id
         session.commit()
+        # The bus relationship and Bus.students don't follow a bus_id change
+        session.expire_all()
         print("\n✅ Student updated successfully.")
     except SQLAlchemyError as e:
         session.rollback()
@@ -217,17 +286,19 @@ def delete_student(session):
     print("=== DELETE STUDENT ===\n")
     print("Type 'cancel' at any prompt to exit.\n")
 
-    students = session.query(Student).all()
+    # List from plain columns; only the student picked below is loaded as an object
+    students = session.query(Student.id, Student.name).all()
     if not students:
         print("⚠️ No students to delete.")
         pause()
         return
 
-    for s in students:
-        print(f"{s.id}. {s.name}")
+    for sid, sname in students:
+        print(f"{sid}. {sname}")
 
     # Get and validate student ID
-    student_id_input = get_valid_input("\nEnter Student ID to delete: ", lambda x: x.isdigit() and int(x) in [s.id for s in students], "⚠️ Invalid Student ID.")
+    student_ids = {s.id for s in students}
+    student_id_input = get_valid_input("\nEnter Student ID to delete: ", lambda x: x.isdigit() and int(x) in student_ids, "⚠️ Invalid Student ID.")
     if student_id_input is None:
         print("Operation cancelled.")
         pause()
@@ -253,6 +324,7 @@ def delete_student(session):
     try:
         session.delete(student)
         session.commit()
+        session.expire_all()  # drop it from its bus's loaded student list
         print("\n✅ Student deleted successfully.")
     except SQLAlchemyError as e:
         session.rollback()
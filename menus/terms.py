@@ -7,11 +7,43 @@ This CLI menu allows the admin to:
 2. Add new terms (requires an academic year).
 3. Edit existing terms (with validation and optional reassignment).
 4. Delete terms (with confirmation to prevent accidental loss).
+5. Bulk-add several terms for one academic year in a single transaction.
 """
 
-from utils.helpers import pause, clear_screen, get_valid_input, confirm_action, is_date, can_delete_record
+import sys
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from utils.helpers import pause, clear_screen, get_valid_input, confirm_action, parse_iso_date, can_delete_record
+from utils.bulk import bulk_insert
 from db_models import Term, AcademicYear, Payment
-from datetime import datetime
+
+LIST_BATCH_SIZE = 200  # rows fetched per round-trip while streaming the term listing
+
+
+# -----------------------------------------------------------------------------
+# TERM PICKER HELPERS
+# -----------------------------------------------------------------------------
+def load_term_choices(session):
+    """
+    Load the rows shown by the edit/delete pickers in one query.
+
+    Returns:
+        tuple: (rows of (id, name, year name, start, end) ordered by id, frozenset of their IDs)
+    """
+    rows = (
+        session.query(Term.id, Term.name, AcademicYear.name, Term.start_date, Term.end_date)
+        .outerjoin(AcademicYear, Term.academic_year_id == AcademicYear.id)
+        .order_by(Term.id)
+        .all()
+    )
+    return rows, frozenset(row.id for row in rows)
+
+
+def print_term_choices(rows):
+    """Write the picker rows from load_term_choices in one go."""
+    sys.stdout.write("".join(
+        f"{tid}. {name} | {year_name} | {start} → {end}\n" for tid, name, year_name, start, end in rows
+    ))
 
 
 # -----------------------------------------------------------------------------
@@ -23,15 +55,27 @@ def list_terms(session):
     Useful for overview before editing or deleting.
     """
     clear_screen()
-    terms = session.query(Term).all()
-
-    if not terms:
+    # Read-only view: plain columns with the year name joined in, no Term objects,
+    # streamed in batches so memory stays flat however many terms there are
+    stmt = (
+        select(Term.id, Term.name, Term.start_date, Term.end_date, AcademicYear.name)
+        .outerjoin(AcademicYear, Term.academic_year_id == AcademicYear.id)
+        .order_by(Term.id)
+        .execution_options(yield_per=LIST_BATCH_SIZE)
+    )
+
+    shown = 0
+    for batch in session.execute(stmt).partitions():
+        if not shown:
+            print("--- School Terms ---")
+        # Show both the date range and linked academic year, one write per batch
+        sys.stdout.write("".join(
+            f"{tid}. {name} | {start} → {end} | Year: {year_name}\n" for tid, name, start, end, year_name in batch
+        ))
+        shown += len(batch)
+
+    if not shown:
         print("No terms found.")
-    else:
-        print("--- School Terms ---")
-        for t in terms:
-            # Show both the date range and linked academic year
-            print(f"{t.id}. {t.name} | {t.start_date} → {t.end_date} | Year: {t.academic_year.name}")
 
     pause()
 
@@ -48,8 +92,8 @@ def add_term(session):
     print("--- Add Term ---")
     print("Type 'cancel' at any prompt to exit.\n")
 
-    # Must have at least one academic year before adding terms
-    years = session.query(AcademicYear).all()
+    # Must have at least one academic year before adding terms; the picker only needs id/name
+    years = session.execute(select(AcademicYear.id, AcademicYear.name)).all()
     if not years:
         print("❌ No academic years found. Please add one first.")
         pause()
@@ -57,21 +101,17 @@ def add_term(session):
 
     # Show available academic years for user to choose from
     print("Select Academic Year:")
-    for y in years:
-        print(f"{y.id}. {y.name}")
+    for year_id, year_name in years:
+        print(f"{year_id}. {year_name}")
 
-    # Validate chosen year
-    year_id_input = get_valid_input("Enter Year ID: ", lambda x: x.isdigit() and int(x) in [y.id for y in years], "⚠️ Invalid Academic Year ID.")
+    # Validate chosen year against the listed ids
+    year_names = dict(years)
+    year_id_input = get_valid_input("Enter Year ID: ", lambda x: x.isdigit() and int(x) in year_names, "⚠️ Invalid Academic Year ID.")
     if year_id_input is None:
         print("Operation cancelled.")
         pause()
         return
     year_id = int(year_id_input)
-    year = session.query(AcademicYear).get(year_id)
-    if not year:
-        print("❌ Invalid academic year selected.")
-        pause()
-        return
 
     # Gather basic term info
     name = get_valid_input("Enter term name (e.g. Term 1): ", lambda x: x.strip(), "⚠️ Name cannot be empty.")
@@ -80,22 +120,18 @@ def add_term(session):
         pause()
         return
 
-    # Collect and validate start/end dates
-    start_str = get_valid_input("Start date (YYYY-MM-DD): ", is_date, "⚠️ Invalid date format. Use YYYY-MM-DD.")
-    if start_str is None:
+    # Collect start/end dates, validated and parsed in one step
+    start_date = get_valid_input("Start date (YYYY-MM-DD): ", error_msg="⚠️ Invalid date format. Use YYYY-MM-DD.", converter=parse_iso_date)
+    if start_date is None:
         print("Operation cancelled.")
         pause()
         return
-    end_str = get_valid_input("End date (YYYY-MM-DD): ", is_date, "⚠️ Invalid date format. Use YYYY-MM-DD.")
-    if end_str is None:
+    end_date = get_valid_input("End date (YYYY-MM-DD): ", error_msg="⚠️ Invalid date format. Use YYYY-MM-DD.", converter=parse_iso_date)
+    if end_date is None:
         print("Operation cancelled.")
         pause()
         return
 
-    # Convert strings → datetime.date objects
-    start_date = datetime.strptime(start_str, "%Y-%m-%d").date()
-    end_date = datetime.strptime(end_str, "%Y-%m-%d").date()
-
     # Validate date logic
     if end_date <= start_date:
         print("❌ End date must be after start date.")
@@ -103,11 +139,13 @@ def add_term(session):
         return
 
     # Create and persist new term record
-    term = Term(name=name, start_date=start_date, end_date=end_date, academic_year=year)
+    term = Term(name=name, start_date=start_date, end_date=end_date, academic_year_id=year_id)
     session.add(term)
     session.commit()
+    # Set by id, so a loaded AcademicYear.terms collection doesn't include it yet
+    session.expire_all()
 
-    print(f"✅ {name} added successfully under {year.name}.")
+    print(f"✅ {name} added successfully under {year_names[year_id]}.")
     pause()
 
 
@@ -123,28 +161,21 @@ def edit_term(session):
     print("--- Edit Term ---")
     print("Type 'cancel' at any prompt to exit.\n")
 
-    terms = session.query(Term).all()
-
+    # List from plain columns; only the term picked below is loaded as an object
+    terms, term_ids = load_term_choices(session)
     if not terms:
         print("No terms available to edit.")
         pause()
         return
-
-    for t in terms:
-        print(f"{t.id}. {t.name} | {t.academic_year.name} | {t.start_date} → {t.end_date}")
+    print_term_choices(terms)
 
     # Prompt for ID of term to edit
-    term_id_input = get_valid_input("\nEnter ID of term to edit: ", lambda x: x.isdigit() and int(x) in [t.id for t in terms], "⚠️ Invalid Term ID.")
+    term_id_input = get_valid_input("\nEnter ID of term to edit: ", lambda x: x.isdigit() and int(x) in term_ids, "⚠️ Invalid Term ID.")
     if term_id_input is None:
         print("Operation cancelled.")
         pause()
         return
-    term_id = int(term_id_input)
-    term = session.query(Term).get(term_id)
-    if not term:
-        print("❌ Invalid term ID.")
-        pause()
-        return
+    term = session.get(Term, int(term_id_input))
 
     # Show existing details for reference
     print(f"\nEditing: {term.name} ({term.academic_year.name})")
@@ -155,21 +186,19 @@ def edit_term(session):
         print("Operation cancelled.")
         pause()
         return
-    new_start = get_valid_input(f"New start date [{term.start_date}]: ", is_date, "⚠️ Invalid date format. Use YYYY-MM-DD.") or str(term.start_date)
-    if new_start is None:
+    # Dates are parsed as they are entered; blank keeps the current one
+    start_date = get_valid_input(f"New start date [{term.start_date}]: ", error_msg="⚠️ Invalid date format. Use YYYY-MM-DD.", converter=lambda x: parse_iso_date(x) if x else term.start_date)
+    if start_date is None:
         print("Operation cancelled.")
         pause()
         return
-    new_end = get_valid_input(f"New end date [{term.end_date}]: ", is_date, "⚠️ Invalid date format. Use YYYY-MM-DD.") or str(term.end_date)
-    if new_end is None:
+    end_date = get_valid_input(f"New end date [{term.end_date}]: ", error_msg="⚠️ Invalid date format. Use YYYY-MM-DD.", converter=lambda x: parse_iso_date(x) if x else term.end_date)
+    if end_date is None:
         print("Operation cancelled.")
         pause()
         return
 
-    # Validate date formats and order
-    start_date = datetime.strptime(new_start, "%Y-%m-%d").date()
-    end_date = datetime.strptime(new_end, "%Y-%m-%d").date()
-
+    # Validate date order
     if end_date <= start_date:
         print("❌ End date must be after start date.")
         pause()
@@ -182,25 +211,22 @@ def edit_term(session):
         pause()
         return
     if reassign.lower() == "y":
-        years = session.query(AcademicYear).all()
-        for y in years:
-            print(f"{y.id}. {y.name}")
-        year_id_input = get_valid_input("Enter new academic year ID: ", lambda x: x.isdigit() and int(x) in [y.id for y in years], "⚠️ Invalid Academic Year ID.")
+        years = session.execute(select(AcademicYear.id, AcademicYear.name)).all()
+        for year_id, year_name in years:
+            print(f"{year_id}. {year_name}")
+        year_ids = {year_id for year_id, _ in years}
+        year_id_input = get_valid_input("Enter new academic year ID: ", lambda x: x.isdigit() and int(x) in year_ids, "⚠️ Invalid Academic Year ID.")
         if year_id_input is None:
             print("Operation cancelled.")
             pause()
             return
-        year_id = int(year_id_input)
-        new_year = session.query(AcademicYear).get(year_id)
-        if not new_year:
-            print("❌ Invalid academic year ID.")
-            pause()
-            return
-        term.academic_year = new_year
+        term.academic_year_id = int(year_id_input)
 
     # Apply final updates
     term.name, term.start_date, term.end_date = new_name, start_date, end_date
     session.commit()
+    # A changed year is set by id; reload Term.academic_year and AcademicYear.terms on next access
+    session.expire_all()
 
     print("✅ Term updated successfully.")
     pause()
@@ -218,28 +244,21 @@ def delete_term(session):
     print("--- Delete Term ---")
     print("Type 'cancel' at any prompt to exit.\n")
 
-    terms = session.query(Term).all()
-
+    # List from plain columns; only the term picked below is loaded as an object
+    terms, term_ids = load_term_choices(session)
     if not terms:
         print("No terms available to delete.")
         pause()
         return
-
-    for t in terms:
-        print(f"{t.id}. {t.name} | {t.academic_year.name} | {t.start_date} → {t.end_date}")
+    print_term_choices(terms)
 
     # Pick term by ID
-    term_id_input = get_valid_input("\nEnter ID of term to delete: ", lambda x: x.isdigit() and int(x) in [t.id for t in terms], "⚠️ Invalid Term ID.")
+    term_id_input = get_valid_input("\nEnter ID of term to delete: ", lambda x: x.isdigit() and int(x) in term_ids, "⚠️ Invalid Term ID.")
     if term_id_input is None:
         print("Operation cancelled.")
         pause()
         return
-    term_id = int(term_id_input)
-    term = session.query(Term).get(term_id)
-    if not term:
-        print("❌ Invalid term ID.")
-        pause()
-        return
+    term = session.get(Term, int(term_id_input))
 
     # Check for dependent payments
     if not can_delete_record(session, Payment, Payment.term_id == term.id, "payment"):
@@ -253,10 +272,87 @@ def delete_term(session):
 
     session.delete(term)
     session.commit()
+    session.expire_all()  # drop it from its year's loaded term list
     print("✅ Term deleted successfully.")
     pause()
 
 
+# -----------------------------------------------------------------------------
+# BULK ADD TERMS
+# -----------------------------------------------------------------------------
+def bulk_add_terms(session):
+    """
+    Collects several terms for one academic year and saves them in one transaction.
+
+    Meant for setting up a new year: nothing is written until the admin
+    finishes, and cancelling discards the whole batch.
+    """
+    clear_screen()
+    print("--- Bulk Add Terms ---")
+    print("Type 'cancel' at any prompt to discard all entries.\n")
+
+    years = session.execute(select(AcademicYear.id, AcademicYear.name)).all()
+    if not years:
+        print("❌ No academic years found. Please add one first.")
+        pause()
+        return
+
+    print("Select Academic Year:")
+    for year_id, year_name in years:
+        print(f"{year_id}. {year_name}")
+
+    year_names = dict(years)
+    year_id_input = get_valid_input("Enter Year ID: ", lambda x: x.isdigit() and int(x) in year_names, "⚠️ Invalid Academic Year ID.")
+    if year_id_input is None:
+        print("Operation cancelled.")
+        pause()
+        return
+    year_id = int(year_id_input)
+
+    print("\nLeave the name blank to finish. Nothing is saved until then.\n")
+    rows = []
+    while True:
+        name = get_valid_input(f"Term #{len(rows) + 1} name (blank to finish): ")
+        if name is None:
+            print("Operation cancelled. No terms were added.")
+            pause()
+            return
+        if not name:
+            break
+
+        start_date = get_valid_input("Start date (YYYY-MM-DD): ", error_msg="⚠️ Invalid date format. Use YYYY-MM-DD.", converter=parse_iso_date)
+        if start_date is None:
+            print("Operation cancelled. No terms were added.")
+            pause()
+            return
+        end_date = get_valid_input("End date (YYYY-MM-DD): ", error_msg="⚠️ Invalid date format. Use YYYY-MM-DD.", converter=parse_iso_date)
+        if end_date is None:
+            print("Operation cancelled. No terms were added.")
+            pause()
+            return
+
+        if end_date <= start_date:
+            print("❌ End date must be after start date. Entry skipped.\n")
+            continue
+        rows.append({"name": name, "start_date": start_date, "end_date": end_date, "academic_year_id": year_id})
+
+    if not rows:
+        print("No terms entered.")
+        pause()
+        return
+
+    try:
+        count = bulk_insert(session, Term, rows)
+        # Inserted through Core, so the year's loaded term list doesn't include them yet
+        session.expire_all()
+        print(f"✅ Added {count} term(s) under {year_names[year_id]}.")
+    except SQLAlchemyError as e:
+        session.rollback()
+        print(f"❌ Error adding terms, none were saved: {e}")
+
+    pause()
+
+
 # -----------------------------------------------------------------------------
 # MAIN MENU CONTROLLER
 # -----------------------------------------------------------------------------
@@ -270,7 +366,7 @@ def terms_menu(session):
     - Edit or delete existing terms
     - Return to the main menu
 
-    The loop only exits when option '5' is chosen.
+    The loop only exits when option '6' is chosen.
     """
     while True:
         clear_screen()
@@ -279,7 +375,8 @@ def terms_menu(session):
         print("2. Add Term")
         print("3. Edit Term")
         print("4. Delete Term")
-        print("5. Back to Main Menu")
+        print("5. Bulk Add Terms")
+        print("6. Back to Main Menu")
 
         choice = input("\nSelect option: ").strip()
 
@@ -292,6 +389,8 @@ def terms_menu(session):
         elif choice == "4":
             delete_term(session)
         elif choice == "5":
+            bulk_add_terms(session)
+        elif choice == "6":
             break
         else:
             print("Invalid option.")
@@ -0,0 +1,65 @@
+"""
+utils/bulk.py
+Bulk-ingest helpers for the School Transport Management System.
+
+Features:
+- Multi-row INSERTs through SQLAlchemy Core (one statement batch, one commit).
+- CSV loading into row dictionaries for admin imports.
+
+Error Handling:
+- File and column problems raise IOError/ValueError for the calling menu to report.
+- Database errors propagate unchanged; callers are expected to roll back.
+"""
+
+import csv
+from sqlalchemy import insert
+
+
+def read_csv_rows(path: str, required_columns) -> list:
+    """
+    Read a CSV file with a header row into a list of dicts.
+
+    Args:
+        path (str): Path to the CSV file.
+        required_columns (iterable): Column names that must be present in the header.
+
+    Returns:
+        list: One dict per data row, keyed by header name (values stripped).
+
+    Raises:
+        ValueError: If a required column is missing or a row has more fields than the header.
+    """
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.DictReader(file)
+        missing = [col for col in required_columns if col not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"missing column(s): {', '.join(missing)}")
+        rows = []
+        for row in reader:
+            # DictReader collects surplus fields as a list under the None key
+            if None in row:
+                raise ValueError(f"line {reader.line_num}: too many fields")
+            rows.append({key: (value or "").strip() for key, value in row.items()})
+        return rows
+
+
+def bulk_insert(session, model, rows: list, chunk: int = 1000) -> int:
+    """
+    Insert many rows for a model in as few statements as possible, then commit once.
+
+    Args:
+        session: Active SQLAlchemy session.
+        model: Mapped class to insert into (e.g. AcademicYear).
+        rows (list): List of dicts mapping column names to values.
+        chunk (int): Maximum number of rows sent per INSERT batch.
+
+    Returns:
+        int: Number of rows inserted.
+    """
+    if not rows:
+        return 0
+    stmt = insert(model)
+    for start in range(0, len(rows), chunk):
+        session.execute(stmt, rows[start:start + chunk])
+    session.commit()
+    return len(rows)
@@ -12,6 +12,7 @@ Features:
 Dependencies:
 - Python's os module for system commands.
 - re module for regex-based validation.
+- SQLAlchemy for lightweight record checks (table probes, dependency counts).
 
 Error Handling:
 - Provides fallback for invalid inputs.
@@ -20,12 +21,40 @@ Error Handling:
 
 import os
 import re
-from datetime import datetime
+import sys
+from datetime import date
+from functools import lru_cache
+from sqlalchemy import select
+
+# Compiled once at import; validators run on every prompt retry.
+# Phone: digits, spaces, hyphens, parentheses, and a leading plus sign.
+_PHONE_RE = re.compile(r'^[\+]?[0-9\s\-\(\)]+$')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Phone separators ignored when checking the minimum length
+_PHONE_STRIP = str.maketrans('', '', ' -()')
+
+# Size of the result caches on the pure string validators below; a retried
+# (e.g. pasted or repeated) bad value is answered without re-parsing it
+VALIDATOR_CACHE_SIZE = 256
+
+# Words that cancel any get_valid_input prompt (compared lower-cased)
+_CANCEL_WORDS = frozenset(("cancel", "exit"))
+
+# ANSI "erase display" + "cursor home"
+_ANSI_CLEAR = "\x1b[2J\x1b[H"
+# Probed once at import: Unix terminals handle ANSI escapes, and on Windows so do
+# Windows Terminal (WT_SESSION) and terminals that set TERM (mintty, ConEmu, ...).
+# The classic Windows console may not, so it keeps the system command.
+_ANSI_TERMINAL = os.name != "nt" or "WT_SESSION" in os.environ or "TERM" in os.environ
 
 
 def clear_screen():
     """Clear the terminal screen (cross-platform)."""
-    # Using system command for simplicity; Windows uses 'cls', Unix uses 'clear'.
+    # An escape sequence saves spawning 'cls'/'clear' on every redraw
+    if _ANSI_TERMINAL and sys.stdout.isatty():
+        sys.stdout.write(_ANSI_CLEAR)
+        sys.stdout.flush()
+        return
     os.system("cls" if os.name == "nt" else "clear")
 
 
@@ -35,7 +64,7 @@ def pause(msg: str = "Press Enter to continue..."):
     input(msg)
 
 
-def get_valid_input(prompt: str, validation_func=None, error_msg: str = "Invalid input. Please try again."):
+def get_valid_input(prompt: str, validation_func=None, error_msg: str = "Invalid input. Please try again.", converter=None):
     """
     Get user input with optional validation and retry on errors.
 
@@ -43,20 +72,29 @@ def get_valid_input(prompt: str, validation_func=None, error_msg: str = "Invalid
         prompt (str): The prompt message for the user.
         validation_func (callable): Optional function to validate input (should return True if valid).
         error_msg (str): Error message to display on invalid input.
+        converter (callable): Optional function that parses the input into its final value,
+            returning None when the input is invalid. Lets callers validate and convert in one step.
 
     Returns:
-        str: Validated user input, or None if user cancels.
+        str: Validated user input (or the converted value), or None if user cancels.
     """
     while True:
         user_input = input(prompt).strip()
-        if user_input.lower() in ['cancel', 'exit']:
+        if user_input.lower() in _CANCEL_WORDS:
             return None  # Allow cancellation
         if validation_func and not validation_func(user_input):
             print(error_msg)
             continue
+        if converter:
+            value = converter(user_input)
+            if value is None:
+                print(error_msg)
+                continue
+            return value
         return user_input
 
 
+@lru_cache(maxsize=VALIDATOR_CACHE_SIZE)
 def is_numeric(value: str) -> bool:
     """Check if the input is a valid number (int or float)."""
     try:
@@ -76,6 +114,7 @@ def is_non_negative_number(value: str) -> bool:
     return is_numeric(value) and float(value) >= 0
 
 
+@lru_cache(maxsize=VALIDATOR_CACHE_SIZE)
 def is_integer(value: str) -> bool:
     """Check if the input is a valid integer."""
     try:
@@ -95,26 +134,32 @@ def is_non_negative_integer(value: str) -> bool:
     return is_integer(value) and int(value) >= 0
 
 
+@lru_cache(maxsize=VALIDATOR_CACHE_SIZE)
 def is_phone_number(value: str) -> bool:
     """Check if the input is a valid phone number (basic regex for digits and common formats)."""
-    # Simple regex for phone numbers: allows digits, spaces, hyphens, parentheses, and plus sign
-    phone_pattern = re.compile(r'^[\+]?[0-9\s\-\(\)]+$')
-    return bool(phone_pattern.match(value)) and len(value.replace(' ', '').replace('-', '').replace('(', '').replace(')', '')) >= 7
+    # Fast path for the common plain-digits entry; isascii keeps non-ASCII digits on the regex path
+    if value.isdigit() and value.isascii():
+        return len(value) >= 7
+    return bool(_PHONE_RE.match(value)) and len(value.translate(_PHONE_STRIP)) >= 7
+
 
+def is_optional_phone_number(value: str) -> bool:
+    """Check if the input is blank or a valid phone number (for optional contact fields)."""
+    return not value or is_phone_number(value)
 
+
+@lru_cache(maxsize=VALIDATOR_CACHE_SIZE)
 def is_email(value: str) -> bool:
     """Check if the input is a valid email address."""
-    email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-    return bool(email_pattern.match(value))
+    return _EMAIL_RE.match(value) is not None
 
 
-def is_date(value: str) -> bool:
-    """Check if the input is a valid date in YYYY-MM-DD format."""
+def parse_iso_date(value: str):
+    """Parse a YYYY-MM-DD string into a date, or return None if it is not a valid date."""
     try:
-        datetime.strptime(value, "%Y-%m-%d")
-        return True
+        return date.fromisoformat(value.strip())
     except ValueError:
-        return False
+        return None
 
 
 def confirm_action(action: str) -> bool:
@@ -149,6 +194,11 @@ def search_list(items: list, search_term: str, key_func=None) -> list:
     return [item for item in items if search_term in (key_func(item).lower() if key_func else str(item).lower())]
 
 
+def table_has_rows(session, model) -> bool:
+    """Return True if the model's table has at least one row (SELECT id ... LIMIT 1)."""
+    return session.execute(select(model.id).limit(1)).first() is not None
+
+
 def can_delete_record(session, model, filter_condition, dependency_label):
     """
     Checks if dependent records exist before deletion.